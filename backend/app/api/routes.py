@@ -11,12 +11,12 @@ from app.models.requests import (
     ImageGenerationRequest, ImageGenerationResponse, ImageVariationRequest, ImageEditRequest
 )
 from app.models.responses import GenerationResponse, SummarizeResponse, StreamChunk, ErrorResponse
-from app.services.generation_service import GenerationService
+from app.services.generation_service import generation_service
 from app.services.input_processor import input_processor
 from app.services.analytics_service import analytics_service
 from app.services.generation_analytics_service import generation_analytics_service
 from app.services.language_service import language_service
-from app.services.model_availability_service import model_availability_service
+from app.services.model_availability_service import ModelAvailabilityService, get_model_availability_service
 from app.services.prompt_template_service import prompt_template_service
 from app.services.export_service import export_service
 from app.services.rag_service import rag_service
@@ -479,7 +479,6 @@ def sort_voices_by_quality(voices: List[Dict[str, Any]], language: str) -> List[
     return sorted(voices, key=voice_score, reverse=True)
 
 router = APIRouter()
-generation_service = GenerationService()
 
 
 @router.post("/generate", response_model=GenerationResponse)
@@ -803,13 +802,8 @@ async def analyze_generation(request: dict):
 async def get_prompt_templates():
     """Get all available prompt templates."""
     try:
-        templates = prompt_template_service.get_all_templates()
-        categories = prompt_template_service.get_categories()
-        
-        return {
-            "templates": templates,
-            "categories": categories
-        }
+        # The template set is fixed, so the body is encoded once by the service
+        return Response(content=prompt_template_service.get_all_templates_json(), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get templates: {str(e)}")
 
@@ -818,11 +812,10 @@ async def get_prompt_templates():
 async def get_templates_by_category(category: str):
     """Get templates filtered by category."""
     try:
-        templates = prompt_template_service.get_templates_by_category(category)
-        return {
-            "templates": templates,
-            "category": category
-        }
+        return Response(
+            content=prompt_template_service.get_templates_by_category_json(category),
+            media_type="application/json"
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get templates: {str(e)}")
 
@@ -957,7 +950,9 @@ async def get_supported_languages():
 
 
 @router.get("/models")
-async def get_available_models():
+async def get_available_models(
+    model_availability_service: ModelAvailabilityService = Depends(get_model_availability_service)
+):
     """Get available model providers and their configurations."""
     # Get Ollama models with availability status
     ollama_models_data = await model_availability_service.get_models_with_availability()
@@ -1100,6 +1095,17 @@ async def get_image_generation_providers():
     }
 
 
+@router.get("/models/catalog")
+async def get_model_catalog(
+    model_availability_service: ModelAvailabilityService = Depends(get_model_availability_service)
+):
+    """Get the static open-source model catalog without availability status."""
+    return Response(
+        content=model_availability_service.get_open_source_models_json(),
+        media_type="application/json"
+    )
+
+
 # RAG Endpoints
 @router.post("/rag/upload", response_model=DocumentUploadResponse)
 async def upload_document_for_rag(
@@ -15,6 +15,8 @@ class Settings(BaseSettings):
     # Ollama Configuration
     ollama_base_url: str = "http://localhost:11434"
     ollama_model: str = "llama3.2:3b"
+    # Optional Unix socket exposing Ollama (e.g. via a local proxy); TCP is used when empty
+    ollama_uds_path: str = ""
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -30,6 +32,16 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000
     
+    # Language Detection/Translation Cache
+    # Set to a Redis URL (e.g. redis://localhost:6379/0) to share results across workers
+    language_cache_url: str = ""
+    language_cache_ttl: int = 86400
+    
+    # NLTK Data
+    # Download missing tokenizer/stopword/sentiment data at startup; disable when
+    # the data is installed ahead of time (see setup.sh)
+    nltk_auto_download: bool = True
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
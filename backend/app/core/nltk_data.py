@@ -0,0 +1,53 @@
+import logging
+import ssl
+from functools import lru_cache
+
+import nltk
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# NLTK resources used by the analytics services, as (data path, downloader package)
+NLTK_RESOURCES = (
+    ('tokenizers/punkt', 'punkt'),
+    ('corpora/stopwords', 'stopwords'),
+    ('sentiment/vader_lexicon.zip', 'vader_lexicon'),
+)
+
+
+@lru_cache(maxsize=None)
+def ensure_nltk_data() -> None:
+    """Fetch any missing NLTK resources, once per process.
+
+    NLTK data is installed by setup.sh; missing resources are only fetched when
+    NLTK_AUTO_DOWNLOAD is enabled, never on the request path.
+    """
+    if not settings.nltk_auto_download:
+        return
+
+    missing_packages = []
+    for resource, package in NLTK_RESOURCES:
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            missing_packages.append(package)
+
+    if not missing_packages:
+        return
+
+    # Fix SSL certificate issues for NLTK downloads
+    try:
+        _create_unverified_https_context = ssl._create_unverified_context
+    except AttributeError:
+        pass
+    else:
+        ssl._create_default_https_context = _create_unverified_https_context
+
+    # Download required NLTK data (with SSL error handling)
+    logger.info(f"Downloading missing NLTK data: {', '.join(missing_packages)}")
+    for package in missing_packages:
+        try:
+            nltk.download(package, quiet=True)
+        except Exception as e:
+            logger.warning(f"Failed to download NLTK package {package}: {str(e)}")
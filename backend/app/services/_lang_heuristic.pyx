@@ -0,0 +1,48 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Native implementation of the character-set language heuristic.
+
+Mirrors ``_classify_script`` in ``language_service.py``, which remains the
+fallback when this extension has not been compiled.
+"""
+
+
+def classify_script(str sample):
+    """Classify a text sample by Unicode script in a single pass."""
+    cdef Py_UCS4 char
+    cdef Py_ssize_t length = len(sample)
+    cdef Py_ssize_t non_ascii = 0
+    cdef Py_ssize_t zh = 0, ja = 0, ko = 0, ar = 0
+    cdef Py_ssize_t best = 0
+    cdef str language = 'zh'
+
+    for char in sample:
+        if char < 128:
+            continue
+        non_ascii += 1
+        if 0x4e00 <= char <= 0x9fff:
+            zh += 1
+        elif 0x3040 <= char <= 0x30ff:
+            ja += 1
+        elif 0xac00 <= char <= 0xd7af:
+            ko += 1
+        elif 0x0600 <= char <= 0x06ff:
+            ar += 1
+
+    if not non_ascii:
+        return 'en', 0.8
+
+    # Japanese text mixes kana with kanji from the CJK ideograph block
+    if ja:
+        ja += zh
+
+    best = zh
+    if ja > best:
+        best, language = ja, 'ja'
+    if ko > best:
+        best, language = ko, 'ko'
+    if ar > best:
+        best, language = ar, 'ar'
+
+    if not best:
+        return 'en', 0.5
+    return language, round(0.5 + 0.4 * best / length, 3)
@@ -1,46 +1,15 @@
 import re
 from typing import Dict, List, Tuple, Optional
 from textstat import textstat
-import nltk
 from nltk.tokenize import word_tokenize, sent_tokenize
 from nltk.corpus import stopwords
 from nltk.sentiment import SentimentIntensityAnalyzer
 from collections import Counter
 import math
-import ssl
 
-# Fix SSL certificate issues for NLTK downloads
-try:
-    _create_unverified_https_context = ssl._create_unverified_context
-except AttributeError:
-    pass
-else:
-    ssl._create_default_https_context = _create_unverified_https_context
+from app.core.nltk_data import ensure_nltk_data
 
-# Download required NLTK data (with SSL error handling)
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    try:
-        nltk.download('punkt', quiet=True)
-    except Exception:
-        pass
-
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    try:
-        nltk.download('stopwords', quiet=True)
-    except Exception:
-        pass
-
-try:
-    nltk.data.find('vader_lexicon')
-except LookupError:
-    try:
-        nltk.download('vader_lexicon', quiet=True)
-    except Exception:
-        pass
+ensure_nltk_data()
 
 
 class GenerationAnalyticsService:
@@ -5,6 +5,7 @@ from app.services.model_factory import model_factory
 from app.services.language_service import language_service
 from app.services.output_formatter_service import output_formatter_service
 from app.models.responses import TokenUsage, StreamChunk
+import asyncio
 import time
 import json
 
@@ -197,7 +198,10 @@ class GenerationService:
                 candidate_content = candidate_handler.content
                 if translate_response and target_language != "en":
                     try:
-                        translation_result = language_service.translate_text(
+                        # The translator makes a blocking HTTP call; run it off the
+                        # event loop so concurrent generations are not serialized
+                        translation_result = await asyncio.to_thread(
+                            language_service.translate_text,
                             candidate_content, 
                             target_language, 
                             "auto"
@@ -341,7 +345,8 @@ class GenerationService:
             # Translate if requested
             if translate_summary and target_language != "en":
                 try:
-                    translation_result = language_service.translate_text(
+                    translation_result = await asyncio.to_thread(
+                        language_service.translate_text,
                         summary_content, 
                         target_language, 
                         "en"
@@ -409,4 +414,8 @@ class GenerationService:
             return f"{base_prompt} Create a news-style summary following the 5W1H format (Who, What, When, Where, Why, How). Focus on the most newsworthy aspects, key facts, and current relevance. Write in a journalistic style."
         
         else:
-            return base_prompt 
\ No newline at end of file
+            return base_prompt
+
+
+# Global generation service instance shared by the API routes and model comparison
+generation_service = GenerationService()
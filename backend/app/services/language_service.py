@@ -1,9 +1,16 @@
 import re
-from typing import Dict, List, Optional, Tuple
-from langdetect import detect, detect_langs, DetectorFactory
+import sys
+import json
+import time
+import threading
+from hashlib import blake2b
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Protocol, Tuple
+from langdetect import detect_langs, DetectorFactory
 from deep_translator import GoogleTranslator
 import pycld2 as cld2
 import logging
+from app.core.config import settings
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -16,199 +23,354 @@ logger = logging.getLogger(__name__)
 # Set seed for consistent language detection
 DetectorFactory.seed = 0
 
+# Number of leading characters inspected by the character-set heuristic
+_HEURISTIC_SAMPLE_SIZE = 100
+
+# Unicode code point ranges used by the heuristic as (lo, hi, language)
+_SCRIPT_RANGES = (
+    (0x4e00, 0x9fff, 'zh'),  # CJK Unified Ideographs
+    (0x3040, 0x309f, 'ja'),  # Hiragana
+    (0x30a0, 0x30ff, 'ja'),  # Katakana
+    (0xac00, 0xd7af, 'ko'),  # Hangul Syllables
+    (0x0600, 0x06ff, 'ar'),  # Arabic
+)
+
+
+def _classify_script(sample: str) -> Tuple[str, float]:
+    """Classify a text sample by Unicode script in a single pass.
+
+    Each character is binned into a per-script counter and the dominant
+    script wins, with confidence scaled by its share of the sample.
+    """
+    counts = {'zh': 0, 'ja': 0, 'ko': 0, 'ar': 0}
+    non_ascii = 0
+    for char in sample:
+        code_point = ord(char)
+        if code_point < 128:
+            continue
+        non_ascii += 1
+        for lo, hi, language in _SCRIPT_RANGES:
+            if lo <= code_point <= hi:
+                counts[language] += 1
+                break
+    
+    if not non_ascii:
+        return 'en', 0.8
+    
+    # Japanese text mixes kana with kanji from the CJK ideograph block
+    if counts['ja']:
+        counts['ja'] += counts['zh']
+    
+    language = max(counts, key=counts.get)
+    if not counts[language]:
+        return 'en', 0.5
+    return language, round(0.5 + 0.4 * counts[language] / len(sample), 3)
+
+
+# Prefer the ahead-of-time compiled classifier when the optional extension
+# has been built; it imports with no warm-up, unlike a JIT-compiled helper
+try:
+    from app.services._lang_heuristic import classify_script as _classify_script
+    logger.debug("Using compiled script-range heuristic")
+except ImportError:
+    logger.debug("Compiled script-range heuristic not built, using pure-Python fallback")
+
+
+# Simplified language families
+_LANGUAGE_FAMILIES = {
+    'en': 'Germanic', 'de': 'Germanic', 'nl': 'Germanic', 'sv': 'Germanic', 
+    'da': 'Germanic', 'no': 'Germanic', 'is': 'Germanic', 'af': 'Germanic',
+    'fr': 'Romance', 'es': 'Romance', 'it': 'Romance', 'pt': 'Romance',
+    'ro': 'Romance', 'ca': 'Romance', 'gl': 'Romance', 'oc': 'Romance',
+    'ru': 'Slavic', 'pl': 'Slavic', 'uk': 'Slavic', 'bg': 'Slavic',
+    'hr': 'Slavic', 'sr': 'Slavic', 'sk': 'Slavic', 'sl': 'Slavic',
+    'zh': 'Sino-Tibetan', 'ja': 'Japonic', 'ko': 'Koreanic',
+    'ar': 'Afro-Asiatic', 'he': 'Afro-Asiatic', 'fa': 'Indo-Iranian',
+    'hi': 'Indo-Iranian', 'bn': 'Indo-Iranian', 'ur': 'Indo-Iranian',
+    'th': 'Tai-Kadai', 'vi': 'Austroasiatic', 'id': 'Austronesian',
+    'ms': 'Austronesian', 'tr': 'Turkic', 'az': 'Turkic', 'kk': 'Turkic',
+    'uz': 'Turkic', 'ky': 'Turkic', 'tg': 'Indo-Iranian', 'tk': 'Turkic',
+    'mn': 'Mongolic', 'ka': 'Kartvelian', 'hy': 'Indo-European',
+    'am': 'Afro-Asiatic', 'sw': 'Niger-Congo', 'zu': 'Niger-Congo',
+    'ne': 'Indo-Iranian', 'si': 'Indo-Iranian', 'my': 'Sino-Tibetan',
+    'km': 'Austroasiatic', 'lo': 'Tai-Kadai', 'bo': 'Sino-Tibetan',
+    'dz': 'Sino-Tibetan', 'ug': 'Turkic', 'yi': 'Germanic',
+    'ku': 'Indo-Iranian', 'ps': 'Indo-Iranian', 'sd': 'Indo-Iranian'
+}
+_LANGUAGE_FAMILIES = {sys.intern(code): family for code, family in _LANGUAGE_FAMILIES.items()}
+
+# Supported languages with their English and native names
+_SUPPORTED_LANGUAGES = {
+    'en': {'name': 'English', 'native': 'English'},
+    'es': {'name': 'Spanish', 'native': 'Español'},
+    'fr': {'name': 'French', 'native': 'Français'},
+    'de': {'name': 'German', 'native': 'Deutsch'},
+    'it': {'name': 'Italian', 'native': 'Italiano'},
+    'pt': {'name': 'Portuguese', 'native': 'Português'},
+    'ru': {'name': 'Russian', 'native': 'Русский'},
+    'ja': {'name': 'Japanese', 'native': '日本語'},
+    'ko': {'name': 'Korean', 'native': '한국어'},
+    'zh': {'name': 'Chinese', 'native': '中文'},
+    'ar': {'name': 'Arabic', 'native': 'العربية'},
+    'hi': {'name': 'Hindi', 'native': 'हिन्दी'},
+    'nl': {'name': 'Dutch', 'native': 'Nederlands'},
+    'sv': {'name': 'Swedish', 'native': 'Svenska'},
+    'da': {'name': 'Danish', 'native': 'Dansk'},
+    'no': {'name': 'Norwegian', 'native': 'Norsk'},
+    'fi': {'name': 'Finnish', 'native': 'Suomi'},
+    'pl': {'name': 'Polish', 'native': 'Polski'},
+    'tr': {'name': 'Turkish', 'native': 'Türkçe'},
+    'he': {'name': 'Hebrew', 'native': 'עברית'},
+    'th': {'name': 'Thai', 'native': 'ไทย'},
+    'vi': {'name': 'Vietnamese', 'native': 'Tiếng Việt'},
+    'id': {'name': 'Indonesian', 'native': 'Bahasa Indonesia'},
+    'ms': {'name': 'Malay', 'native': 'Bahasa Melayu'},
+    'fa': {'name': 'Persian', 'native': 'فارسی'},
+    'ur': {'name': 'Urdu', 'native': 'اردو'},
+    'bn': {'name': 'Bengali', 'native': 'বাংলা'},
+    'ta': {'name': 'Tamil', 'native': 'தமிழ்'},
+    'te': {'name': 'Telugu', 'native': 'తెలుగు'},
+    'mr': {'name': 'Marathi', 'native': 'मराठी'},
+    'gu': {'name': 'Gujarati', 'native': 'ગુજરાતી'},
+    'kn': {'name': 'Kannada', 'native': 'ಕನ್ನಡ'},
+    'ml': {'name': 'Malayalam', 'native': 'മലയാളം'},
+    'pa': {'name': 'Punjabi', 'native': 'ਪੰਜਾਬੀ'},
+    'or': {'name': 'Odia', 'native': 'ଓଡ଼ିଆ'},
+    'as': {'name': 'Assamese', 'native': 'অসমীয়া'},
+    'ne': {'name': 'Nepali', 'native': 'नेपाली'},
+    'si': {'name': 'Sinhala', 'native': 'සිංහල'},
+    'my': {'name': 'Burmese', 'native': 'မြန်မာ'},
+    'km': {'name': 'Khmer', 'native': 'ខ្មែរ'},
+    'lo': {'name': 'Lao', 'native': 'ລາວ'},
+    'mn': {'name': 'Mongolian', 'native': 'Монгол'},
+    'ka': {'name': 'Georgian', 'native': 'ქართული'},
+    'am': {'name': 'Amharic', 'native': 'አማርኛ'},
+    'sw': {'name': 'Swahili', 'native': 'Kiswahili'},
+    'zu': {'name': 'Zulu', 'native': 'isiZulu'},
+    'af': {'name': 'Afrikaans', 'native': 'Afrikaans'},
+    'is': {'name': 'Icelandic', 'native': 'Íslenska'},
+    'ga': {'name': 'Irish', 'native': 'Gaeilge'},
+    'cy': {'name': 'Welsh', 'native': 'Cymraeg'},
+    'eu': {'name': 'Basque', 'native': 'Euskara'},
+    'ca': {'name': 'Catalan', 'native': 'Català'},
+    'gl': {'name': 'Galician', 'native': 'Galego'},
+    'ro': {'name': 'Romanian', 'native': 'Română'},
+    'bg': {'name': 'Bulgarian', 'native': 'Български'},
+    'hr': {'name': 'Croatian', 'native': 'Hrvatski'},
+    'sr': {'name': 'Serbian', 'native': 'Српски'},
+    'sk': {'name': 'Slovak', 'native': 'Slovenčina'},
+    'sl': {'name': 'Slovenian', 'native': 'Slovenščina'},
+    'et': {'name': 'Estonian', 'native': 'Eesti'},
+    'lv': {'name': 'Latvian', 'native': 'Latviešu'},
+    'lt': {'name': 'Lithuanian', 'native': 'Lietuvių'},
+    'mt': {'name': 'Maltese', 'native': 'Malti'},
+    'sq': {'name': 'Albanian', 'native': 'Shqip'},
+    'mk': {'name': 'Macedonian', 'native': 'Македонски'},
+    'bs': {'name': 'Bosnian', 'native': 'Bosanski'},
+    'me': {'name': 'Montenegrin', 'native': 'Crnogorski'},
+    'ky': {'name': 'Kyrgyz', 'native': 'Кыргызча'},
+    'kk': {'name': 'Kazakh', 'native': 'Қазақша'},
+    'uz': {'name': 'Uzbek', 'native': 'Oʻzbekcha'},
+    'tg': {'name': 'Tajik', 'native': 'Тоҷикӣ'},
+    'tk': {'name': 'Turkmen', 'native': 'Türkmençe'},
+    'az': {'name': 'Azerbaijani', 'native': 'Azərbaycanca'},
+    'hy': {'name': 'Armenian', 'native': 'Հայերեն'},
+    'ku': {'name': 'Kurdish', 'native': 'Kurdî'},
+    'ps': {'name': 'Pashto', 'native': 'پښتو'},
+    'sd': {'name': 'Sindhi', 'native': 'سنڌي'},
+    'bo': {'name': 'Tibetan', 'native': 'བོད་ཡིག'},
+    'dz': {'name': 'Dzongkha', 'native': 'རྫོང་ཁ'},
+    'ug': {'name': 'Uyghur', 'native': 'ئۇيغۇرچە'},
+    'yi': {'name': 'Yiddish', 'native': 'יידיש'},
+    'lb': {'name': 'Luxembourgish', 'native': 'Lëtzebuergesch'},
+    'fo': {'name': 'Faroese', 'native': 'Føroyskt'},
+    'sm': {'name': 'Samoan', 'native': 'Gagana Samoa'},
+    'to': {'name': 'Tongan', 'native': 'Lea faka-Tonga'},
+    'fj': {'name': 'Fijian', 'native': 'Vosa vaka-Viti'},
+    'mi': {'name': 'Maori', 'native': 'Te Reo Māori'},
+    'haw': {'name': 'Hawaiian', 'native': 'ʻŌlelo Hawaiʻi'},
+    'co': {'name': 'Corsican', 'native': 'Corsu'},
+    'sc': {'name': 'Sardinian', 'native': 'Sardu'},
+    'vec': {'name': 'Venetian', 'native': 'Vèneto'},
+    'fur': {'name': 'Friulian', 'native': 'Furlan'},
+    'lld': {'name': 'Ladin', 'native': 'Ladin'},
+    'rm': {'name': 'Romansh', 'native': 'Rumantsch'},
+    'gsw': {'name': 'Swiss German', 'native': 'Schwiizertüütsch'},
+    'bar': {'name': 'Bavarian', 'native': 'Boarisch'},
+    'ksh': {'name': 'Colognian', 'native': 'Kölsch'},
+    'nds': {'name': 'Low German', 'native': 'Plattdüütsch'},
+    'pdc': {'name': 'Pennsylvania German', 'native': 'Pennsilfaanisch Deitsch'},
+    'pfl': {'name': 'Palatinate German', 'native': 'Pälzisch'},
+    'sxu': {'name': 'Upper Saxon', 'native': 'Obersächsisch'},
+    'wae': {'name': 'Walser', 'native': 'Walser'},
+    'als': {'name': 'Alemannic', 'native': 'Alemannisch'},
+    'swg': {'name': 'Swabian', 'native': 'Schwäbisch'},
+    'grc': {'name': 'Ancient Greek', 'native': 'Ἀρχαία ἑλληνικὴ'},
+    'la': {'name': 'Latin', 'native': 'Latina'},
+    'ang': {'name': 'Old English', 'native': 'Englisc'},
+    'fro': {'name': 'Old French', 'native': 'Ancien français'},
+    'goh': {'name': 'Old High German', 'native': 'Althochdeutsch'},
+    'non': {'name': 'Old Norse', 'native': 'Norrænt'},
+    'got': {'name': 'Gothic', 'native': '𐌲𐌿𐍄𐌹𐍃𐌺'},
+    'sga': {'name': 'Old Irish', 'native': 'Sean-Ghaeilge'},
+    'owl': {'name': 'Old Welsh', 'native': 'Hen Gymraeg'},
+    'xcl': {'name': 'Classical Armenian', 'native': 'Գրաբար'},
+    'peo': {'name': 'Old Persian', 'native': '𐎠𐎼𐎡𐎹'},
+    'sa': {'name': 'Sanskrit', 'native': 'संस्कृतम्'},
+    'pal': {'name': 'Pahlavi', 'native': '𐭯𐭠𐭧𐭫𐭥𐭩𐭪'},
+    'ae': {'name': 'Avestan', 'native': '𐬀𐬎𐬯𐬙𐬀'},
+    'hit': {'name': 'Hittite', 'native': '𒉈𒅆𒇷'},
+    'akk': {'name': 'Akkadian', 'native': '𒀝𒅗𒁺𒌑'},
+    'sux': {'name': 'Sumerian', 'native': '𒅴𒂠'},
+    'egy': {'name': 'Egyptian', 'native': '𓂋𓏺𓈖 𓆎𓅓𓏏𓊖'},
+    'cop': {'name': 'Coptic', 'native': 'Ⲙⲉⲧⲣⲉⲙⲛ̀ⲭⲏⲙⲓ'},
+    'arc': {'name': 'Aramaic', 'native': 'ܐܪܡܝܐ'},
+    'phn': {'name': 'Phoenician', 'native': '𐤃𐤁𐤓𐤉𐤌 𐤊𐤍𐤏𐤍𐤉𐤌'},
+    'uga': {'name': 'Ugaritic', 'native': '𐎜𐎂𐎗𐎚'},
+    'xpr': {'name': 'Parthian', 'native': '𐭀𐭓𐭔𐭊'},
+    'xsc': {'name': 'Scythian', 'native': '𐎿𐎤𐎢𐎭𐎠'},
+    'xss': {'name': 'Sarmatian', 'native': '𐎿𐎠𐎼𐎷𐎠𐎫'},
+    'xme': {'name': 'Median', 'native': '𐎶𐎠𐎭'},
+    'xbc': {'name': 'Bactrian', 'native': 'Αριαο'},
+    'xhc': {'name': 'Hunnic', 'native': '𐰴𐰍𐰣'},
+    'xav': {'name': 'Avar', 'native': 'Авар'},
+    'xbu': {'name': 'Bulgar', 'native': '𐰉𐰆𐰞𐰍𐰺'},
+    'xkh': {'name': 'Khazar', 'native': '𐰴𐰔𐰺'},
+    'xpe': {'name': 'Pecheneg', 'native': '𐰯𐰲𐰤𐰴'},
+    'xcu': {'name': 'Church Slavic', 'native': 'ⰔⰎⰑⰂⰡⰐⰠⰔⰍⰟ'},
+    'xbm': {'name': 'Middle Breton', 'native': 'Brezhoneg krenn'},
+    'xcb': {'name': 'Cumbric', 'native': 'Cumbraek'},
+    'xga': {'name': 'Old Irish', 'native': 'Goídelc'},
+    'xgl': {'name': 'Galician', 'native': 'Galego'},
+    'xgm': {'name': 'Middle High German', 'native': 'Mittelhochdeutsch'},
+    'xgo': {'name': 'Old Georgian', 'native': 'ძველი ქართული'},
+    'xgr': {'name': 'Ancient Greek', 'native': 'Ἀρχαία ἑλληνικὴ'},
+    'xhe': {'name': 'Ancient Hebrew', 'native': 'עברית עתיקה'},
+    'xhi': {'name': 'Old Hindi', 'native': 'पुरानी हिंदी'},
+    'xhr': {'name': 'Old Croatian', 'native': 'Staro hrvatski'},
+    'xhu': {'name': 'Old Hungarian', 'native': 'Ómagyar'},
+    'xhy': {'name': 'Old Armenian', 'native': 'Հին հայերեն'},
+    'xid': {'name': 'Old Indonesian', 'native': 'Bahasa Indonesia Kuno'},
+    'xja': {'name': 'Old Japanese', 'native': '上古日本語'},
+    'xka': {'name': 'Old Georgian', 'native': 'ძველი ქართული'},
+    'xko': {'name': 'Old Korean', 'native': '고대 한국어'},
+    'xla': {'name': 'Latin', 'native': 'Latina'},
+    'xlt': {'name': 'Old Lithuanian', 'native': 'Senasis lietuvių'},
+    'xmk': {'name': 'Old Macedonian', 'native': 'Старомакедонски'},
+    'xmn': {'name': 'Middle Mongolian', 'native': 'Дундад монгол'},
+    'xmr': {'name': 'Old Marathi', 'native': 'जुनी मराठी'},
+    'xms': {'name': 'Old Malay', 'native': 'Bahasa Melayu Kuno'},
+    'xmy': {'name': 'Old Burmese', 'native': 'ပျူ'},
+    'xne': {'name': 'Old Nepali', 'native': 'पुरानो नेपाली'},
+    'xno': {'name': 'Old Norse', 'native': 'Norrænt'},
+    'xoc': {'name': 'Old Occitan', 'native': 'Occitan ancian'},
+    'xpe': {'name': 'Old Persian', 'native': '𐎠𐎼𐎡𐎹'},
+    'xpl': {'name': 'Old Polish', 'native': 'Stary polski'},
+    'xpt': {'name': 'Old Portuguese', 'native': 'Português antigo'},
+    'xro': {'name': 'Old Romanian', 'native': 'Română veche'},
+    'xru': {'name': 'Old Russian', 'native': 'Древнерусский'},
+    'xsa': {'name': 'Old Sanskrit', 'native': 'प्राचीन संस्कृतम्'},
+    'xsc': {'name': 'Old Scythian', 'native': '𐎿𐎤𐎢𐎭𐎠'},
+    'xsk': {'name': 'Old Slovak', 'native': 'Starý slovenský'},
+    'xsl': {'name': 'Old Slovenian', 'native': 'Stari slovenski'},
+    'xsp': {'name': 'Old Spanish', 'native': 'Español antiguo'},
+    'xsv': {'name': 'Old Swedish', 'native': 'Fornsvenska'},
+    'xta': {'name': 'Old Tamil', 'native': 'பழைய தமிழ்'},
+    'xtc': {'name': 'Old Telugu', 'native': 'పాత తెలుగు'},
+    'xth': {'name': 'Old Thai', 'native': 'ภาษาไทยโบราณ'},
+    'xtr': {'name': 'Old Turkish', 'native': 'Eski Türkçe'},
+    'xuk': {'name': 'Old Ukrainian', 'native': 'Староукраїнська'},
+    'xur': {'name': 'Old Urdu', 'native': 'پرانے اردو'},
+    'xvi': {'name': 'Old Vietnamese', 'native': 'Tiếng Việt cổ'},
+    'xzh': {'name': 'Old Chinese', 'native': '上古漢語'},
+    'xzu': {'name': 'Old Zulu', 'native': 'IsiZulu esidala'},
+}
+_SUPPORTED_LANGUAGES = {sys.intern(code): info for code, info in _SUPPORTED_LANGUAGES.items()}
+
+# Interned table keys, used to canonicalize codes arriving from requests;
+# built once and read-only so service instances never mutate shared state
+_CANONICAL_CODES: Mapping[str, str] = MappingProxyType(
+    {code: code for code in (*_LANGUAGE_FAMILIES, *_SUPPORTED_LANGUAGES)}
+)
+
+
+def _canon(language_code: str) -> str:
+    """Map a language code onto the interned table key when one exists.
+
+    Matching is exact and case-sensitive, as table lookups always were.
+    Unknown codes are returned unchanged and not interned, so arbitrary
+    user input never grows the interpreter's intern table.
+    """
+    return _CANONICAL_CODES.get(language_code, language_code)
+
+
+class _CacheProtocol(Protocol):
+    """Minimal key/value interface shared by the in-process and Redis caches."""
+    
+    def get(self, key: str) -> Optional[bytes]:
+        ...
+    
+    def setex(self, key: str, ttl: int, value: bytes) -> None:
+        ...
+
+
+class _InMemoryCache:
+    """In-process cache with per-key expiry, used when no shared cache is configured.
+    
+    Detection and translation run in worker threads, so every access holds a lock.
+    """
+    
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: Dict[str, Tuple[float, bytes]] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+    
+    def setex(self, key: str, ttl: int, value: bytes) -> None:
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                # Evict the oldest insertion to keep memory bounded
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic() + ttl, value)
+
+
+def _create_cache_backend() -> _CacheProtocol:
+    """Create the Redis cache when configured, falling back to an in-process cache."""
+    if settings.language_cache_url:
+        try:
+            import redis
+            return redis.Redis.from_url(settings.language_cache_url)
+        except Exception as e:
+            logger.warning(f"Shared language cache unavailable, using in-process cache: {e}")
+    return _InMemoryCache()
+
+
+def _text_digest(text: str) -> str:
+    """Stable digest of the text used in cache keys."""
+    return blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
 class LanguageService:
     """Service for language detection and translation."""
     
-    def __init__(self):
+    def __init__(self, cache_backend: Optional[_CacheProtocol] = None):
+        self.cache = cache_backend if cache_backend is not None else _create_cache_backend()
+        self.cache_ttl = settings.language_cache_ttl
         self.supported_languages = self._get_supported_languages()
     
     def _get_supported_languages(self) -> Dict[str, Dict[str, str]]:
         """Get supported languages with their codes and names."""
-        return {
-            'en': {'name': 'English', 'native': 'English'},
-            'es': {'name': 'Spanish', 'native': 'Español'},
-            'fr': {'name': 'French', 'native': 'Français'},
-            'de': {'name': 'German', 'native': 'Deutsch'},
-            'it': {'name': 'Italian', 'native': 'Italiano'},
-            'pt': {'name': 'Portuguese', 'native': 'Português'},
-            'ru': {'name': 'Russian', 'native': 'Русский'},
-            'ja': {'name': 'Japanese', 'native': '日本語'},
-            'ko': {'name': 'Korean', 'native': '한국어'},
-            'zh': {'name': 'Chinese', 'native': '中文'},
-            'ar': {'name': 'Arabic', 'native': 'العربية'},
-            'hi': {'name': 'Hindi', 'native': 'हिन्दी'},
-            'nl': {'name': 'Dutch', 'native': 'Nederlands'},
-            'sv': {'name': 'Swedish', 'native': 'Svenska'},
-            'da': {'name': 'Danish', 'native': 'Dansk'},
-            'no': {'name': 'Norwegian', 'native': 'Norsk'},
-            'fi': {'name': 'Finnish', 'native': 'Suomi'},
-            'pl': {'name': 'Polish', 'native': 'Polski'},
-            'tr': {'name': 'Turkish', 'native': 'Türkçe'},
-            'he': {'name': 'Hebrew', 'native': 'עברית'},
-            'th': {'name': 'Thai', 'native': 'ไทย'},
-            'vi': {'name': 'Vietnamese', 'native': 'Tiếng Việt'},
-            'id': {'name': 'Indonesian', 'native': 'Bahasa Indonesia'},
-            'ms': {'name': 'Malay', 'native': 'Bahasa Melayu'},
-            'fa': {'name': 'Persian', 'native': 'فارسی'},
-            'ur': {'name': 'Urdu', 'native': 'اردو'},
-            'bn': {'name': 'Bengali', 'native': 'বাংলা'},
-            'ta': {'name': 'Tamil', 'native': 'தமிழ்'},
-            'te': {'name': 'Telugu', 'native': 'తెలుగు'},
-            'mr': {'name': 'Marathi', 'native': 'मराठी'},
-            'gu': {'name': 'Gujarati', 'native': 'ગુજરાતી'},
-            'kn': {'name': 'Kannada', 'native': 'ಕನ್ನಡ'},
-            'ml': {'name': 'Malayalam', 'native': 'മലയാളം'},
-            'pa': {'name': 'Punjabi', 'native': 'ਪੰਜਾਬੀ'},
-            'or': {'name': 'Odia', 'native': 'ଓଡ଼ିଆ'},
-            'as': {'name': 'Assamese', 'native': 'অসমীয়া'},
-            'ne': {'name': 'Nepali', 'native': 'नेपाली'},
-            'si': {'name': 'Sinhala', 'native': 'සිංහල'},
-            'my': {'name': 'Burmese', 'native': 'မြန်မာ'},
-            'km': {'name': 'Khmer', 'native': 'ខ្មែរ'},
-            'lo': {'name': 'Lao', 'native': 'ລາວ'},
-            'mn': {'name': 'Mongolian', 'native': 'Монгол'},
-            'ka': {'name': 'Georgian', 'native': 'ქართული'},
-            'am': {'name': 'Amharic', 'native': 'አማርኛ'},
-            'sw': {'name': 'Swahili', 'native': 'Kiswahili'},
-            'zu': {'name': 'Zulu', 'native': 'isiZulu'},
-            'af': {'name': 'Afrikaans', 'native': 'Afrikaans'},
-            'is': {'name': 'Icelandic', 'native': 'Íslenska'},
-            'ga': {'name': 'Irish', 'native': 'Gaeilge'},
-            'cy': {'name': 'Welsh', 'native': 'Cymraeg'},
-            'eu': {'name': 'Basque', 'native': 'Euskara'},
-            'ca': {'name': 'Catalan', 'native': 'Català'},
-            'gl': {'name': 'Galician', 'native': 'Galego'},
-            'ro': {'name': 'Romanian', 'native': 'Română'},
-            'bg': {'name': 'Bulgarian', 'native': 'Български'},
-            'hr': {'name': 'Croatian', 'native': 'Hrvatski'},
-            'sr': {'name': 'Serbian', 'native': 'Српски'},
-            'sk': {'name': 'Slovak', 'native': 'Slovenčina'},
-            'sl': {'name': 'Slovenian', 'native': 'Slovenščina'},
-            'et': {'name': 'Estonian', 'native': 'Eesti'},
-            'lv': {'name': 'Latvian', 'native': 'Latviešu'},
-            'lt': {'name': 'Lithuanian', 'native': 'Lietuvių'},
-            'mt': {'name': 'Maltese', 'native': 'Malti'},
-            'sq': {'name': 'Albanian', 'native': 'Shqip'},
-            'mk': {'name': 'Macedonian', 'native': 'Македонски'},
-            'bs': {'name': 'Bosnian', 'native': 'Bosanski'},
-            'me': {'name': 'Montenegrin', 'native': 'Crnogorski'},
-            'ky': {'name': 'Kyrgyz', 'native': 'Кыргызча'},
-            'kk': {'name': 'Kazakh', 'native': 'Қазақша'},
-            'uz': {'name': 'Uzbek', 'native': 'Oʻzbekcha'},
-            'tg': {'name': 'Tajik', 'native': 'Тоҷикӣ'},
-            'tk': {'name': 'Turkmen', 'native': 'Türkmençe'},
-            'az': {'name': 'Azerbaijani', 'native': 'Azərbaycanca'},
-            'hy': {'name': 'Armenian', 'native': 'Հայերեն'},
-            'ku': {'name': 'Kurdish', 'native': 'Kurdî'},
-            'ps': {'name': 'Pashto', 'native': 'پښتو'},
-            'sd': {'name': 'Sindhi', 'native': 'سنڌي'},
-            'bo': {'name': 'Tibetan', 'native': 'བོད་ཡིག'},
-            'dz': {'name': 'Dzongkha', 'native': 'རྫོང་ཁ'},
-            'ug': {'name': 'Uyghur', 'native': 'ئۇيغۇرچە'},
-            'yi': {'name': 'Yiddish', 'native': 'יידיש'},
-            'lb': {'name': 'Luxembourgish', 'native': 'Lëtzebuergesch'},
-            'fo': {'name': 'Faroese', 'native': 'Føroyskt'},
-            'sm': {'name': 'Samoan', 'native': 'Gagana Samoa'},
-            'to': {'name': 'Tongan', 'native': 'Lea faka-Tonga'},
-            'fj': {'name': 'Fijian', 'native': 'Vosa vaka-Viti'},
-            'mi': {'name': 'Maori', 'native': 'Te Reo Māori'},
-            'haw': {'name': 'Hawaiian', 'native': 'ʻŌlelo Hawaiʻi'},
-            'co': {'name': 'Corsican', 'native': 'Corsu'},
-            'sc': {'name': 'Sardinian', 'native': 'Sardu'},
-            'vec': {'name': 'Venetian', 'native': 'Vèneto'},
-            'fur': {'name': 'Friulian', 'native': 'Furlan'},
-            'lld': {'name': 'Ladin', 'native': 'Ladin'},
-            'rm': {'name': 'Romansh', 'native': 'Rumantsch'},
-            'gsw': {'name': 'Swiss German', 'native': 'Schwiizertüütsch'},
-            'bar': {'name': 'Bavarian', 'native': 'Boarisch'},
-            'ksh': {'name': 'Colognian', 'native': 'Kölsch'},
-            'nds': {'name': 'Low German', 'native': 'Plattdüütsch'},
-            'pdc': {'name': 'Pennsylvania German', 'native': 'Pennsilfaanisch Deitsch'},
-            'pfl': {'name': 'Palatinate German', 'native': 'Pälzisch'},
-            'sxu': {'name': 'Upper Saxon', 'native': 'Obersächsisch'},
-            'wae': {'name': 'Walser', 'native': 'Walser'},
-            'als': {'name': 'Alemannic', 'native': 'Alemannisch'},
-            'swg': {'name': 'Swabian', 'native': 'Schwäbisch'},
-            'grc': {'name': 'Ancient Greek', 'native': 'Ἀρχαία ἑλληνικὴ'},
-            'la': {'name': 'Latin', 'native': 'Latina'},
-            'ang': {'name': 'Old English', 'native': 'Englisc'},
-            'fro': {'name': 'Old French', 'native': 'Ancien français'},
-            'goh': {'name': 'Old High German', 'native': 'Althochdeutsch'},
-            'non': {'name': 'Old Norse', 'native': 'Norrænt'},
-            'got': {'name': 'Gothic', 'native': '𐌲𐌿𐍄𐌹𐍃𐌺'},
-            'sga': {'name': 'Old Irish', 'native': 'Sean-Ghaeilge'},
-            'owl': {'name': 'Old Welsh', 'native': 'Hen Gymraeg'},
-            'xcl': {'name': 'Classical Armenian', 'native': 'Գրաբար'},
-            'peo': {'name': 'Old Persian', 'native': '𐎠𐎼𐎡𐎹'},
-            'sa': {'name': 'Sanskrit', 'native': 'संस्कृतम्'},
-            'pal': {'name': 'Pahlavi', 'native': '𐭯𐭠𐭧𐭫𐭥𐭩𐭪'},
-            'ae': {'name': 'Avestan', 'native': '𐬀𐬎𐬯𐬙𐬀'},
-            'hit': {'name': 'Hittite', 'native': '𒉈𒅆𒇷'},
-            'akk': {'name': 'Akkadian', 'native': '𒀝𒅗𒁺𒌑'},
-            'sux': {'name': 'Sumerian', 'native': '𒅴𒂠'},
-            'egy': {'name': 'Egyptian', 'native': '𓂋𓏺𓈖 𓆎𓅓𓏏𓊖'},
-            'cop': {'name': 'Coptic', 'native': 'Ⲙⲉⲧⲣⲉⲙⲛ̀ⲭⲏⲙⲓ'},
-            'arc': {'name': 'Aramaic', 'native': 'ܐܪܡܝܐ'},
-            'phn': {'name': 'Phoenician', 'native': '𐤃𐤁𐤓𐤉𐤌 𐤊𐤍𐤏𐤍𐤉𐤌'},
-            'uga': {'name': 'Ugaritic', 'native': '𐎜𐎂𐎗𐎚'},
-            'xpr': {'name': 'Parthian', 'native': '𐭀𐭓𐭔𐭊'},
-            'xsc': {'name': 'Scythian', 'native': '𐎿𐎤𐎢𐎭𐎠'},
-            'xss': {'name': 'Sarmatian', 'native': '𐎿𐎠𐎼𐎷𐎠𐎫'},
-            'xme': {'name': 'Median', 'native': '𐎶𐎠𐎭'},
-            'xbc': {'name': 'Bactrian', 'native': 'Αριαο'},
-            'xhc': {'name': 'Hunnic', 'native': '𐰴𐰍𐰣'},
-            'xav': {'name': 'Avar', 'native': 'Авар'},
-            'xbu': {'name': 'Bulgar', 'native': '𐰉𐰆𐰞𐰍𐰺'},
-            'xkh': {'name': 'Khazar', 'native': '𐰴𐰔𐰺'},
-            'xpe': {'name': 'Pecheneg', 'native': '𐰯𐰲𐰤𐰴'},
-            'xcu': {'name': 'Church Slavic', 'native': 'ⰔⰎⰑⰂⰡⰐⰠⰔⰍⰟ'},
-            'xbm': {'name': 'Middle Breton', 'native': 'Brezhoneg krenn'},
-            'xcb': {'name': 'Cumbric', 'native': 'Cumbraek'},
-            'xga': {'name': 'Old Irish', 'native': 'Goídelc'},
-            'xgl': {'name': 'Galician', 'native': 'Galego'},
-            'xgm': {'name': 'Middle High German', 'native': 'Mittelhochdeutsch'},
-            'xgo': {'name': 'Old Georgian', 'native': 'ძველი ქართული'},
-            'xgr': {'name': 'Ancient Greek', 'native': 'Ἀρχαία ἑλληνικὴ'},
-            'xhe': {'name': 'Ancient Hebrew', 'native': 'עברית עתיקה'},
-            'xhi': {'name': 'Old Hindi', 'native': 'पुरानी हिंदी'},
-            'xhr': {'name': 'Old Croatian', 'native': 'Staro hrvatski'},
-            'xhu': {'name': 'Old Hungarian', 'native': 'Ómagyar'},
-            'xhy': {'name': 'Old Armenian', 'native': 'Հին հայերեն'},
-            'xid': {'name': 'Old Indonesian', 'native': 'Bahasa Indonesia Kuno'},
-            'xja': {'name': 'Old Japanese', 'native': '上古日本語'},
-            'xka': {'name': 'Old Georgian', 'native': 'ძველი ქართული'},
-            'xko': {'name': 'Old Korean', 'native': '고대 한국어'},
-            'xla': {'name': 'Latin', 'native': 'Latina'},
-            'xlt': {'name': 'Old Lithuanian', 'native': 'Senasis lietuvių'},
-            'xmk': {'name': 'Old Macedonian', 'native': 'Старомакедонски'},
-            'xmn': {'name': 'Middle Mongolian', 'native': 'Дундад монгол'},
-            'xmr': {'name': 'Old Marathi', 'native': 'जुनी मराठी'},
-            'xms': {'name': 'Old Malay', 'native': 'Bahasa Melayu Kuno'},
-            'xmy': {'name': 'Old Burmese', 'native': 'ပျူ'},
-            'xne': {'name': 'Old Nepali', 'native': 'पुरानो नेपाली'},
-            'xno': {'name': 'Old Norse', 'native': 'Norrænt'},
-            'xoc': {'name': 'Old Occitan', 'native': 'Occitan ancian'},
-            'xpe': {'name': 'Old Persian', 'native': '𐎠𐎼𐎡𐎹'},
-            'xpl': {'name': 'Old Polish', 'native': 'Stary polski'},
-            'xpt': {'name': 'Old Portuguese', 'native': 'Português antigo'},
-            'xro': {'name': 'Old Romanian', 'native': 'Română veche'},
-            'xru': {'name': 'Old Russian', 'native': 'Древнерусский'},
-            'xsa': {'name': 'Old Sanskrit', 'native': 'प्राचीन संस्कृतम्'},
-            'xsc': {'name': 'Old Scythian', 'native': '𐎿𐎤𐎢𐎭𐎠'},
-            'xsk': {'name': 'Old Slovak', 'native': 'Starý slovenský'},
-            'xsl': {'name': 'Old Slovenian', 'native': 'Stari slovenski'},
-            'xsp': {'name': 'Old Spanish', 'native': 'Español antiguo'},
-            'xsv': {'name': 'Old Swedish', 'native': 'Fornsvenska'},
-            'xta': {'name': 'Old Tamil', 'native': 'பழைய தமிழ்'},
-            'xtc': {'name': 'Old Telugu', 'native': 'పాత తెలుగు'},
-            'xth': {'name': 'Old Thai', 'native': 'ภาษาไทยโบราณ'},
-            'xtr': {'name': 'Old Turkish', 'native': 'Eski Türkçe'},
-            'xuk': {'name': 'Old Ukrainian', 'native': 'Староукраїнська'},
-            'xur': {'name': 'Old Urdu', 'native': 'پرانے اردو'},
-            'xvi': {'name': 'Old Vietnamese', 'native': 'Tiếng Việt cổ'},
-            'xzh': {'name': 'Old Chinese', 'native': '上古漢語'},
-            'xzu': {'name': 'Old Zulu', 'native': 'IsiZulu esidala'},
-        }
+        return dict(_SUPPORTED_LANGUAGES)
     
     def detect_language(self, text: str) -> Dict[str, any]:
         """Detect the language of the input text using multiple methods."""
@@ -220,12 +382,25 @@ class LanguageService:
                 'alternatives': []
             }
         
+        cache_key = f"lang:{_text_digest(text)}"
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        detection = self._detect_language_uncached(text)
+        self._cache_set(cache_key, detection)
+        return detection
+    
+    def _detect_language_uncached(self, text: str) -> Dict[str, any]:
+        """Run every detection method and pick the most confident result."""
         results = {}
         
         # Method 1: langdetect
         try:
-            langdetect_result = detect(text)
-            langdetect_confidence = max([lang.prob for lang in detect_langs(text)])
+            # detect_langs is sorted by probability, so its head is what detect() returns
+            top_language = detect_langs(text)[0]
+            langdetect_result = top_language.lang
+            langdetect_confidence = top_language.prob
             results['langdetect'] = {
                 'language': langdetect_result,
                 'confidence': langdetect_confidence
@@ -254,20 +429,8 @@ class LanguageService:
         # Method 3: Simple heuristic (fallback)
         try:
             # Simple heuristic based on character sets
-            if any(ord(char) > 127 for char in text[:100]):
-                # Contains non-ASCII characters
-                if any('\u4e00' <= char <= '\u9fff' for char in text[:100]):
-                    results['heuristic'] = {'language': 'zh', 'confidence': 0.7}
-                elif any('\u3040' <= char <= '\u309f' or '\u30a0' <= char <= '\u30ff' for char in text[:100]):
-                    results['heuristic'] = {'language': 'ja', 'confidence': 0.7}
-                elif any('\uac00' <= char <= '\ud7af' for char in text[:100]):
-                    results['heuristic'] = {'language': 'ko', 'confidence': 0.7}
-                elif any('\u0600' <= char <= '\u06ff' for char in text[:100]):
-                    results['heuristic'] = {'language': 'ar', 'confidence': 0.7}
-                else:
-                    results['heuristic'] = {'language': 'en', 'confidence': 0.5}
-            else:
-                results['heuristic'] = {'language': 'en', 'confidence': 0.8}
+            heuristic_lang, heuristic_confidence = _classify_script(text[:_HEURISTIC_SAMPLE_SIZE])
+            results['heuristic'] = {'language': heuristic_lang, 'confidence': heuristic_confidence}
         except Exception as e:
             logger.warning(f"heuristic detection failed: {e}")
             results['heuristic'] = {'language': 'en', 'confidence': 0.0}
@@ -321,17 +484,24 @@ class LanguageService:
                     'no_translation_needed': True
                 }
             
+            cache_key = f"tx:{source_language}:{target_language}:{_text_digest(text)}"
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+            
             # Translate using deep-translator
             translator = GoogleTranslator(source=source_language, target=target_language)
             translated_text = translator.translate(text)
             
-            return {
+            translation = {
                 'translated_text': translated_text,
                 'source_language': source_language,
                 'target_language': target_language,
                 'confidence': 0.9,  # deep-translator doesn't provide confidence scores
                 'original_text': text
             }
+            self._cache_set(cache_key, translation)
+            return translation
             
         except Exception as e:
             logger.error(f"Translation failed: {e}")
@@ -343,46 +513,41 @@ class LanguageService:
                 'error': str(e)
             }
     
+    def _cache_get(self, key: str) -> Optional[Dict[str, any]]:
+        """Fetch a cached result, treating cache failures as misses."""
+        try:
+            value = self.cache.get(key)
+            return json.loads(value) if value is not None else None
+        except Exception as e:
+            logger.warning(f"Language cache read failed: {e}")
+            return None
+    
+    def _cache_set(self, key: str, value: Dict[str, any]) -> None:
+        """Store a result in the cache, ignoring cache failures."""
+        try:
+            self.cache.setex(key, self.cache_ttl, json.dumps(value, ensure_ascii=False).encode('utf-8'))
+        except Exception as e:
+            logger.warning(f"Language cache write failed: {e}")
+    
     def get_supported_languages(self) -> Dict[str, Dict[str, str]]:
         """Get list of supported languages."""
         return self.supported_languages
     
     def get_language_name(self, language_code: str) -> str:
         """Get language name from language code."""
-        return self.supported_languages.get(language_code, {}).get('name', language_code)
+        return self.supported_languages.get(_canon(language_code), {}).get('name', language_code)
     
     def get_native_name(self, language_code: str) -> str:
         """Get native language name from language code."""
-        return self.supported_languages.get(language_code, {}).get('native', language_code)
+        return self.supported_languages.get(_canon(language_code), {}).get('native', language_code)
     
     def is_supported_language(self, language_code: str) -> bool:
         """Check if language is supported."""
-        return language_code in self.supported_languages
+        return _canon(language_code) in self.supported_languages
     
     def get_language_family(self, language_code: str) -> str:
         """Get language family for the given language code."""
-        # Simplified language families
-        families = {
-            'en': 'Germanic', 'de': 'Germanic', 'nl': 'Germanic', 'sv': 'Germanic', 
-            'da': 'Germanic', 'no': 'Germanic', 'is': 'Germanic', 'af': 'Germanic',
-            'fr': 'Romance', 'es': 'Romance', 'it': 'Romance', 'pt': 'Romance',
-            'ro': 'Romance', 'ca': 'Romance', 'gl': 'Romance', 'oc': 'Romance',
-            'ru': 'Slavic', 'pl': 'Slavic', 'uk': 'Slavic', 'bg': 'Slavic',
-            'hr': 'Slavic', 'sr': 'Slavic', 'sk': 'Slavic', 'sl': 'Slavic',
-            'zh': 'Sino-Tibetan', 'ja': 'Japonic', 'ko': 'Koreanic',
-            'ar': 'Afro-Asiatic', 'he': 'Afro-Asiatic', 'fa': 'Indo-Iranian',
-            'hi': 'Indo-Iranian', 'bn': 'Indo-Iranian', 'ur': 'Indo-Iranian',
-            'th': 'Tai-Kadai', 'vi': 'Austroasiatic', 'id': 'Austronesian',
-            'ms': 'Austronesian', 'tr': 'Turkic', 'az': 'Turkic', 'kk': 'Turkic',
-            'uz': 'Turkic', 'ky': 'Turkic', 'tg': 'Indo-Iranian', 'tk': 'Turkic',
-            'mn': 'Mongolic', 'ka': 'Kartvelian', 'hy': 'Indo-European',
-            'am': 'Afro-Asiatic', 'sw': 'Niger-Congo', 'zu': 'Niger-Congo',
-            'ne': 'Indo-Iranian', 'si': 'Indo-Iranian', 'my': 'Sino-Tibetan',
-            'km': 'Austroasiatic', 'lo': 'Tai-Kadai', 'bo': 'Sino-Tibetan',
-            'dz': 'Sino-Tibetan', 'ug': 'Turkic', 'yi': 'Germanic',
-            'ku': 'Indo-Iranian', 'ps': 'Indo-Iranian', 'sd': 'Indo-Iranian'
-        }
-        return families.get(language_code, 'Other')
+        return _LANGUAGE_FAMILIES.get(_canon(language_code), 'Other')
 
 
 # Global language service instance
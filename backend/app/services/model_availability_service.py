@@ -1,316 +1,459 @@
 import asyncio
+import time
+from functools import lru_cache
 import aiohttp
-from typing import Dict, List, Optional
+import ijson
+import orjson
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Tuple
+from operator import itemgetter
 import logging
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Static catalog of open-source models; treat entries as read-only and copy before mutating
+_OPEN_SOURCE_MODELS: Tuple[Mapping[str, Any], ...] = tuple(MappingProxyType(model) for model in [
+    {
+        "name": "qwen3:8b",
+        "display_name": "Qwen 3 (8B)",
+        "description": "Alibaba's 8B parameter model with strong reasoning and multilingual capabilities",
+        "parameters": "8B",
+        "organization": "Alibaba",
+        "license": "Apache 2.0",
+        "download_command": "ollama pull qwen3:8b",
+        "category": "High Performance",
+        "tags": ["reasoning", "multilingual", "alibaba", "high-performance"]
+    },
+    {
+        "name": "qwen2.5:3b",
+        "display_name": "Qwen 2.5 (3B)",
+        "description": "Alibaba's efficient 3B parameter model with strong reasoning capabilities",
+        "parameters": "3B",
+        "organization": "Alibaba",
+        "license": "Apache 2.0",
+        "download_command": "ollama pull qwen2.5:3b",
+        "category": "Reasoning & Analysis",
+        "tags": ["reasoning", "efficient", "multilingual"]
+    },
+    {
+        "name": "phi3:3.8b",
+        "display_name": "Phi-3 (3.8B)",
+        "description": "Microsoft's compact model with excellent performance on reasoning tasks",
+        "parameters": "3.8B",
+        "organization": "Microsoft",
+        "license": "MIT",
+        "download_command": "ollama pull phi3:3.8b",
+        "category": "Reasoning & Analysis",
+        "tags": ["reasoning", "compact", "microsoft"]
+    },
+    {
+        "name": "deepseek-coder:3b",
+        "display_name": "DeepSeek Coder (3B)",
+        "description": "Specialized coding model with strong programming capabilities",
+        "parameters": "3B",
+        "organization": "DeepSeek",
+        "license": "Apache 2.0",
+        "download_command": "ollama pull deepseek-coder:3b",
+        "category": "Coding & Development",
+        "tags": ["coding", "programming", "specialized"]
+    },
+    {
+        "name": "llama3.1:3b",
+        "display_name": "Llama 3.1 (3B)",
+        "description": "Meta's latest compact model with improved performance",
+        "parameters": "3B",
+        "organization": "Meta",
+        "license": "Meta License",
+        "download_command": "ollama pull llama3.1:3b",
+        "category": "General Purpose",
+        "tags": ["general", "meta", "latest"]
+    },
+    {
+        "name": "llama3.2:3b",
+        "display_name": "Llama 3.2 (3B)",
+        "description": "Meta's latest 3B model with improved performance and capabilities",
+        "parameters": "3B",
+        "organization": "Meta",
+        "license": "Meta License",
+        "download_command": "ollama pull llama3.2:3b",
+        "category": "General Purpose",
+        "tags": ["general", "meta", "latest", "llama3.2"]
+    },
+    {
+        "name": "grok:3b",
+        "display_name": "Grok (3B)",
+        "description": "xAI's compact model with conversational abilities",
+        "parameters": "3B",
+        "organization": "xAI",
+        "license": "Apache 2.0",
+        "download_command": "ollama pull grok:3b",
+        "category": "Conversational",
+        "tags": ["conversational", "xai", "chat"]
+    },
+    {
+        "name": "bloom:3b",
+        "display_name": "BLOOM (3B)",
+        "description": "Multilingual model with support for 46+ languages",
+        "parameters": "3B",
+        "organization": "BigScience",
+        "license": "Responsible AI License",
+        "download_command": "ollama pull bloom:3b",
+        "category": "Multilingual",
+        "tags": ["multilingual", "46+ languages", "bloom"]
+    },
+    {
+        "name": "gemma2:3b",
+        "display_name": "Gemma 2 (3B)",
+        "description": "Google's lightweight model optimized for efficiency",
+        "parameters": "3B",
+        "organization": "Google",
+        "license": "Gemma License",
+        "download_command": "ollama pull gemma2:3b",
+        "category": "Efficient",
+        "tags": ["efficient", "google", "lightweight"]
+    },
+    {
+        "name": "mistral:7b",
+        "display_name": "Mistral (7B)",
+        "description": "High-performance 7B model with excellent reasoning",
+        "parameters": "7B",
+        "organization": "Mistral AI",
+        "license": "Apache 2.0",
+        "download_command": "ollama pull mistral:7b",
+        "category": "High Performance",
+        "tags": ["reasoning", "high-performance", "mistral"]
+    },
+    {
+        "name": "mistral-small3.1",
+        "display_name": "Mistral Small 3.1 (Vision)",
+        "description": "Latest multimodal model with vision capabilities and enhanced reasoning",
+        "parameters": "22B",
+        "organization": "Mistral AI",
+        "license": "Apache 2.0",
+        "download_command": "ollama pull mistral-small3.1",
+        "category": "Vision & Multimodal",
+        "tags": ["vision", "multimodal", "reasoning", "mistral", "latest"]
+    },
+    {
+        "name": "mistral-nemo",
+        "display_name": "Mistral Nemo (12B)",
+        "description": "Efficient 12B parameter model with strong reasoning capabilities",
+        "parameters": "12B",
+        "organization": "Mistral AI",
+        "license": "Apache 2.0",
+        "download_command": "ollama pull mistral-nemo",
+        "category": "High Performance",
+        "tags": ["reasoning", "efficient", "mistral"]
+    },
+    {
+        "name": "llava:7b",
+        "display_name": "LLaVA (7B)",
+        "description": "Large Language-and-Vision Assistant for image understanding and analysis",
+        "parameters": "7B",
+        "organization": "Microsoft Research",
+        "license": "Apache 2.0",
+        "download_command": "ollama pull llava:7b",
+        "category": "Vision & Multimodal",
+        "tags": ["vision", "multimodal", "image-analysis", "llava"]
+    },
+    {
+        "name": "llava:13b",
+        "display_name": "LLaVA (13B)",
+        "description": "Larger Language-and-Vision Assistant with enhanced capabilities",
+        "parameters": "13B",
+        "organization": "Microsoft Research",
+        "license": "Apache 2.0",
+        "download_command": "ollama pull llava:13b",
+        "category": "Vision & Multimodal",
+        "tags": ["vision", "multimodal", "image-analysis", "llava", "high-performance"]
+    },
+    {
+        "name": "llama3.2-vision:11b",
+        "display_name": "Llama 3.2 Vision (11B)",
+        "description": "Meta's latest vision model with image understanding capabilities",
+        "parameters": "11B",
+        "organization": "Meta",
+        "license": "Llama License",
+        "download_command": "ollama pull llama3.2-vision:11b",
+        "category": "Vision & Multimodal",
+        "tags": ["vision", "multimodal", "llama", "meta", "latest"]
+    },
+    {
+        "name": "codellama:3b",
+        "display_name": "Code Llama (3B)",
+        "description": "Specialized coding model with code generation capabilities",
+        "parameters": "3B",
+        "organization": "Meta",
+        "license": "Meta License",
+        "download_command": "ollama pull codellama:3b",
+        "category": "Coding & Development",
+        "tags": ["coding", "meta", "code-generation"]
+    },
+    {
+        "name": "neural-chat:3b",
+        "display_name": "Neural Chat (3B)",
+        "description": "Intel's conversational model optimized for dialogue",
+        "parameters": "3B",
+        "organization": "Intel",
+        "license": "Apache 2.0",
+        "download_command": "ollama pull neural-chat:3b",
+        "category": "Conversational",
+        "tags": ["conversational", "intel", "dialogue"]
+    },
+    {
+        "name": "orca-mini:3b",
+        "display_name": "Orca Mini (3B)",
+        "description": "Microsoft's compact model trained on high-quality data",
+        "parameters": "3B",
+        "organization": "Microsoft",
+        "license": "MIT",
+        "download_command": "ollama pull orca-mini:3b",
+        "category": "General Purpose",
+        "tags": ["general", "microsoft", "high-quality"]
+    },
+    {
+        "name": "llama2:3b",
+        "display_name": "Llama 2 (3B)",
+        "description": "Meta's foundational 3B model with broad capabilities",
+        "parameters": "3B",
+        "organization": "Meta",
+        "license": "Meta License",
+        "download_command": "ollama pull llama2:3b",
+        "category": "General Purpose",
+        "tags": ["general", "meta", "foundational"]
+    },
+    {
+        "name": "gpt-oss:20b",
+        "display_name": "GPT-OSS-20B",
+        "description": "OpenAI's open-weight model with powerful reasoning and agentic capabilities",
+        "parameters": "20B",
+        "organization": "OpenAI",
+        "license": "Apache 2.0",
+        "download_command": "ollama pull gpt-oss:20b",
+        "category": "Reasoning & Analysis",
+        "tags": ["reasoning", "agentic", "openai", "open-weight", "function-calling", "advanced-reasoning"]
+    }
+])
+
+
+
+def _collect_facets(models) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Collect the sorted distinct categories and organizations in one pass."""
+    categories, organizations = set(), set()
+    for model in models:
+        categories.add(model["category"])
+        organizations.add(model["organization"])
+    return tuple(sorted(categories)), tuple(sorted(organizations))
+
+
+# Catalog views derived once at import time since the catalog is static
+_OPEN_SOURCE_MODELS_SORTED = tuple(sorted(_OPEN_SOURCE_MODELS, key=itemgetter("display_name")))
+_CATEGORIES, _ORGANIZATIONS = _collect_facets(_OPEN_SOURCE_MODELS)
+
+# Static catalog serialized once so read-only routes can return the bytes as-is
+_CATALOG_JSON: bytes = orjson.dumps({
+    "models": [dict(model) for model in _OPEN_SOURCE_MODELS_SORTED],
+    "total_count": len(_OPEN_SOURCE_MODELS_SORTED),
+    "categories": _CATEGORIES,
+    "organizations": _ORGANIZATIONS
+})
+
+# (is_available, status) pairs for each availability state
+_STATUS_RUNNING = (True, "Available")
+_STATUS_INSTALLED = (False, "Installed (Not Running)")
+_STATUS_DOWNLOAD_REQUIRED = (False, "Download Required")
+
+# Errors an Ollama fetch degrades to an empty result on: an unreachable or slow
+# server, or a well-formed payload that lacks the expected shape (a top-level
+# list, an entry without "name", "models": null)
+_FETCH_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, OSError, ijson.JSONError,
+                 KeyError, TypeError, AttributeError, ValueError)
+
+
 class ModelAvailabilityService:
     """Service for managing model availability and information."""
     
+    _session: Optional[aiohttp.ClientSession] = None
+    
     def __init__(self):
         self.ollama_base_url = "http://localhost:11434"
         self.available_models_cache = None
         self.cache_timestamp = 0
         self.cache_duration = 30  # Cache for 30 seconds
+        self.request_timeout = 1.5  # Per-request deadline for Ollama calls
+        self._session_lock = asyncio.Lock()
+        self._in_flight: Optional[asyncio.Task] = None
+        self._tags_etag: Optional[str] = None
+        self._tags_cached_models: Optional[FrozenSet[str]] = None
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            async with self._session_lock:
+                if self._session is None or self._session.closed:
+                    self._session = aiohttp.ClientSession(
+                        connector=self._create_connector(),
+                        timeout=aiohttp.ClientTimeout(total=5)
+                    )
+        return self._session
+    
+    def _create_connector(self) -> aiohttp.BaseConnector:
+        """Create the pooled connector used by the shared session."""
+        if settings.ollama_uds_path:
+            # Skip the loopback TCP stack when Ollama is reachable over a local socket
+            return aiohttp.UnixConnector(
+                path=settings.ollama_uds_path,
+                limit=100,
+                keepalive_timeout=60
+            )
+        try:
+            # Resolve inside the event loop instead of the getaddrinfo thread pool
+            resolver = aiohttp.AsyncResolver()
+        except RuntimeError:
+            logger.debug("aiodns not installed, using the threaded resolver")
+            resolver = None
+        return aiohttp.TCPConnector(
+            resolver=resolver,
+            use_dns_cache=True,
+            limit=100,
+            limit_per_host=20,
+            ttl_dns_cache=600,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True
+        )
+    
+    async def close(self):
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
         
-    async def get_running_models(self) -> List[str]:
-        """Get list of currently running models from Ollama."""
+    async def get_running_models(self) -> FrozenSet[str]:
+        """Get the names of currently running models from Ollama."""
         try:
-            async with aiohttp.ClientSession() as session:
-                # First check which models are actually running
-                async with session.get(f"{self.ollama_base_url}/api/ps") as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        running_models = [model['name'] for model in data.get('models', [])]
-                        logger.info(f"Running models: {running_models}")
-                        return running_models
-                    else:
-                        logger.warning(f"Failed to fetch running models from Ollama: {response.status}")
-                        return []
-        except Exception as e:
-            logger.error(f"Error fetching available models: {e}")
-            return []
+            session = await self._get_session()
+            # First check which models are actually running
+            async with session.get(f"{self.ollama_base_url}/api/ps") as response:
+                if response.status == 200:
+                    data = orjson.loads(await response.read())
+                    running_models = frozenset(model['name'] for model in data.get('models', ()))
+                    logger.debug("Running models: %s", running_models)
+                    return running_models
+                else:
+                    logger.warning("Failed to fetch running models from Ollama: %s", response.status)
+                    return frozenset()
+        except _FETCH_ERRORS as e:
+            logger.warning("Error fetching running models: %s", e)
+            return frozenset()
 
     async def get_available_models(self) -> List[str]:
         """Backward compatibility method - returns running models."""
-        return await self.get_running_models()
+        return list(await self.get_running_models())
     
     def get_open_source_models(self) -> List[Dict]:
         """Get comprehensive list of open-source models with metadata."""
-        return [
-            {
-                "name": "qwen3:8b",
-                "display_name": "Qwen 3 (8B)",
-                "description": "Alibaba's 8B parameter model with strong reasoning and multilingual capabilities",
-                "parameters": "8B",
-                "organization": "Alibaba",
-                "license": "Apache 2.0",
-                "download_command": "ollama pull qwen3:8b",
-                "category": "High Performance",
-                "tags": ["reasoning", "multilingual", "alibaba", "high-performance"]
-            },
-            {
-                "name": "qwen2.5:3b",
-                "display_name": "Qwen 2.5 (3B)",
-                "description": "Alibaba's efficient 3B parameter model with strong reasoning capabilities",
-                "parameters": "3B",
-                "organization": "Alibaba",
-                "license": "Apache 2.0",
-                "download_command": "ollama pull qwen2.5:3b",
-                "category": "Reasoning & Analysis",
-                "tags": ["reasoning", "efficient", "multilingual"]
-            },
-            {
-                "name": "phi3:3.8b",
-                "display_name": "Phi-3 (3.8B)",
-                "description": "Microsoft's compact model with excellent performance on reasoning tasks",
-                "parameters": "3.8B",
-                "organization": "Microsoft",
-                "license": "MIT",
-                "download_command": "ollama pull phi3:3.8b",
-                "category": "Reasoning & Analysis",
-                "tags": ["reasoning", "compact", "microsoft"]
-            },
-            {
-                "name": "deepseek-coder:3b",
-                "display_name": "DeepSeek Coder (3B)",
-                "description": "Specialized coding model with strong programming capabilities",
-                "parameters": "3B",
-                "organization": "DeepSeek",
-                "license": "Apache 2.0",
-                "download_command": "ollama pull deepseek-coder:3b",
-                "category": "Coding & Development",
-                "tags": ["coding", "programming", "specialized"]
-            },
-            {
-                "name": "llama3.1:3b",
-                "display_name": "Llama 3.1 (3B)",
-                "description": "Meta's latest compact model with improved performance",
-                "parameters": "3B",
-                "organization": "Meta",
-                "license": "Meta License",
-                "download_command": "ollama pull llama3.1:3b",
-                "category": "General Purpose",
-                "tags": ["general", "meta", "latest"]
-            },
-            {
-                "name": "llama3.2:3b",
-                "display_name": "Llama 3.2 (3B)",
-                "description": "Meta's latest 3B model with improved performance and capabilities",
-                "parameters": "3B",
-                "organization": "Meta",
-                "license": "Meta License",
-                "download_command": "ollama pull llama3.2:3b",
-                "category": "General Purpose",
-                "tags": ["general", "meta", "latest", "llama3.2"]
-            },
-            {
-                "name": "grok:3b",
-                "display_name": "Grok (3B)",
-                "description": "xAI's compact model with conversational abilities",
-                "parameters": "3B",
-                "organization": "xAI",
-                "license": "Apache 2.0",
-                "download_command": "ollama pull grok:3b",
-                "category": "Conversational",
-                "tags": ["conversational", "xai", "chat"]
-            },
-            {
-                "name": "bloom:3b",
-                "display_name": "BLOOM (3B)",
-                "description": "Multilingual model with support for 46+ languages",
-                "parameters": "3B",
-                "organization": "BigScience",
-                "license": "Responsible AI License",
-                "download_command": "ollama pull bloom:3b",
-                "category": "Multilingual",
-                "tags": ["multilingual", "46+ languages", "bloom"]
-            },
-            {
-                "name": "gemma2:3b",
-                "display_name": "Gemma 2 (3B)",
-                "description": "Google's lightweight model optimized for efficiency",
-                "parameters": "3B",
-                "organization": "Google",
-                "license": "Gemma License",
-                "download_command": "ollama pull gemma2:3b",
-                "category": "Efficient",
-                "tags": ["efficient", "google", "lightweight"]
-            },
-            {
-                "name": "mistral:7b",
-                "display_name": "Mistral (7B)",
-                "description": "High-performance 7B model with excellent reasoning",
-                "parameters": "7B",
-                "organization": "Mistral AI",
-                "license": "Apache 2.0",
-                "download_command": "ollama pull mistral:7b",
-                "category": "High Performance",
-                "tags": ["reasoning", "high-performance", "mistral"]
-            },
-            {
-                "name": "mistral-small3.1",
-                "display_name": "Mistral Small 3.1 (Vision)",
-                "description": "Latest multimodal model with vision capabilities and enhanced reasoning",
-                "parameters": "22B",
-                "organization": "Mistral AI",
-                "license": "Apache 2.0",
-                "download_command": "ollama pull mistral-small3.1",
-                "category": "Vision & Multimodal",
-                "tags": ["vision", "multimodal", "reasoning", "mistral", "latest"]
-            },
-            {
-                "name": "mistral-nemo",
-                "display_name": "Mistral Nemo (12B)",
-                "description": "Efficient 12B parameter model with strong reasoning capabilities",
-                "parameters": "12B",
-                "organization": "Mistral AI",
-                "license": "Apache 2.0",
-                "download_command": "ollama pull mistral-nemo",
-                "category": "High Performance",
-                "tags": ["reasoning", "efficient", "mistral"]
-            },
-            {
-                "name": "llava:7b",
-                "display_name": "LLaVA (7B)",
-                "description": "Large Language-and-Vision Assistant for image understanding and analysis",
-                "parameters": "7B",
-                "organization": "Microsoft Research",
-                "license": "Apache 2.0",
-                "download_command": "ollama pull llava:7b",
-                "category": "Vision & Multimodal",
-                "tags": ["vision", "multimodal", "image-analysis", "llava"]
-            },
-            {
-                "name": "llava:13b",
-                "display_name": "LLaVA (13B)",
-                "description": "Larger Language-and-Vision Assistant with enhanced capabilities",
-                "parameters": "13B",
-                "organization": "Microsoft Research",
-                "license": "Apache 2.0",
-                "download_command": "ollama pull llava:13b",
-                "category": "Vision & Multimodal",
-                "tags": ["vision", "multimodal", "image-analysis", "llava", "high-performance"]
-            },
-            {
-                "name": "llama3.2-vision:11b",
-                "display_name": "Llama 3.2 Vision (11B)",
-                "description": "Meta's latest vision model with image understanding capabilities",
-                "parameters": "11B",
-                "organization": "Meta",
-                "license": "Llama License",
-                "download_command": "ollama pull llama3.2-vision:11b",
-                "category": "Vision & Multimodal",
-                "tags": ["vision", "multimodal", "llama", "meta", "latest"]
-            },
-            {
-                "name": "codellama:3b",
-                "display_name": "Code Llama (3B)",
-                "description": "Specialized coding model with code generation capabilities",
-                "parameters": "3B",
-                "organization": "Meta",
-                "license": "Meta License",
-                "download_command": "ollama pull codellama:3b",
-                "category": "Coding & Development",
-                "tags": ["coding", "meta", "code-generation"]
-            },
-            {
-                "name": "neural-chat:3b",
-                "display_name": "Neural Chat (3B)",
-                "description": "Intel's conversational model optimized for dialogue",
-                "parameters": "3B",
-                "organization": "Intel",
-                "license": "Apache 2.0",
-                "download_command": "ollama pull neural-chat:3b",
-                "category": "Conversational",
-                "tags": ["conversational", "intel", "dialogue"]
-            },
-            {
-                "name": "orca-mini:3b",
-                "display_name": "Orca Mini (3B)",
-                "description": "Microsoft's compact model trained on high-quality data",
-                "parameters": "3B",
-                "organization": "Microsoft",
-                "license": "MIT",
-                "download_command": "ollama pull orca-mini:3b",
-                "category": "General Purpose",
-                "tags": ["general", "microsoft", "high-quality"]
-            },
-            {
-                "name": "llama2:3b",
-                "display_name": "Llama 2 (3B)",
-                "description": "Meta's foundational 3B model with broad capabilities",
-                "parameters": "3B",
-                "organization": "Meta",
-                "license": "Meta License",
-                "download_command": "ollama pull llama2:3b",
-                "category": "General Purpose",
-                "tags": ["general", "meta", "foundational"]
-            },
-            {
-                "name": "gpt-oss:20b",
-                "display_name": "GPT-OSS-20B",
-                "description": "OpenAI's open-weight model with powerful reasoning and agentic capabilities",
-                "parameters": "20B",
-                "organization": "OpenAI",
-                "license": "Apache 2.0",
-                "download_command": "ollama pull gpt-oss:20b",
-                "category": "Reasoning & Analysis",
-                "tags": ["reasoning", "agentic", "openai", "open-weight", "function-calling", "advanced-reasoning"]
-            }
-        ]
+        return [dict(model) for model in _OPEN_SOURCE_MODELS]
+    
+    def get_open_source_models_json(self) -> bytes:
+        """Get the static catalog, without availability, as pre-serialized JSON."""
+        return _CATALOG_JSON
     
-    async def get_installed_models(self) -> List[str]:
-        """Get list of installed models from Ollama."""
+    async def get_installed_models(self) -> FrozenSet[str]:
+        """Get the names of installed models from Ollama."""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.ollama_base_url}/api/tags") as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        installed_models = [model['name'] for model in data.get('models', [])]
-                        logger.info(f"Installed models: {installed_models}")
-                        return installed_models
-                    else:
-                        logger.warning(f"Failed to fetch installed models from Ollama: {response.status}")
-                        return []
-        except Exception as e:
-            logger.error(f"Error fetching installed models: {e}")
-            return []
+            session = await self._get_session()
+            # Revalidate with the last ETag so an unchanged tag list comes back as an empty 304
+            headers = {"If-None-Match": self._tags_etag} if self._tags_etag else None
+            async with session.get(f"{self.ollama_base_url}/api/tags", headers=headers) as response:
+                if response.status == 304 and self._tags_cached_models is not None:
+                    return self._tags_cached_models
+                if response.status == 200:
+                    # Stream only the names out of the payload; each entry also carries
+                    # size, digest and details we would otherwise materialize and discard
+                    installed_models = frozenset([
+                        name async for name in ijson.items(response.content, 'models.item.name')
+                    ])
+                    logger.debug("Installed models: %s", installed_models)
+                    self._tags_etag = response.headers.get("ETag")
+                    self._tags_cached_models = installed_models
+                    return installed_models
+                else:
+                    logger.warning("Failed to fetch installed models from Ollama: %s", response.status)
+                    return frozenset()
+        except _FETCH_ERRORS as e:
+            logger.warning("Error fetching installed models: %s", e)
+            return frozenset()
 
     async def get_models_with_availability(self) -> Dict:
-        """Get models with their availability status."""
-        # Get currently running models
-        running_models = await self.get_running_models()
+        """Get models with their availability status, cached for cache_duration seconds."""
+        if self._is_cache_fresh():
+            return self.available_models_cache
         
-        # Get installed models
-        installed_models = await self.get_installed_models()
-        
-        # Get all open-source models
-        all_models = self.get_open_source_models()
+        # Coalesce concurrent callers onto a single in-flight refresh
+        if self._in_flight is None or self._in_flight.done():
+            self._in_flight = asyncio.create_task(self._refresh_models_with_availability())
+        # Shield so one cancelled caller does not cancel the refresh for the others
+        return await asyncio.shield(self._in_flight)
+    
+    async def _refresh_models_with_availability(self) -> Dict:
+        """Rebuild the availability result and store it in the cache."""
+        result = await self._build_models_with_availability()
+        self.available_models_cache = result
+        self.cache_timestamp = time.monotonic()
+        return result
+    
+    def _is_cache_fresh(self) -> bool:
+        """Check whether the cached availability result is still valid."""
+        return (
+            self.available_models_cache is not None
+            and time.monotonic() - self.cache_timestamp < self.cache_duration
+        )
+    
+    def _degrade_on_timeout(self, result, label: str) -> FrozenSet[str]:
+        """Map a timed out Ollama fetch to an empty result; re-raise any other error."""
+        if isinstance(result, asyncio.TimeoutError):
+            logger.warning("Timed out fetching %s models from Ollama after %ss", label, self.request_timeout)
+            return frozenset()
+        if isinstance(result, BaseException):
+            raise result
+        return result
+    
+    async def _build_models_with_availability(self) -> Dict:
+        """Query Ollama and build the availability overlay for the catalog."""
+        # Get currently running and installed models concurrently, each with its own
+        # deadline so a slow endpoint cannot hold up the other. Both fetches always
+        # run to completion before either result (or error) is looked at
+        running_result, installed_result = await asyncio.gather(
+            asyncio.wait_for(self.get_running_models(), self.request_timeout),
+            asyncio.wait_for(self.get_installed_models(), self.request_timeout),
+            return_exceptions=True
+        )
+        running_models = self._degrade_on_timeout(running_result, "running")
+        installed_models = self._degrade_on_timeout(installed_result, "installed")
         
-        # Mark availability status
-        for model in all_models:
-            if model["name"] in running_models:
-                model["is_available"] = True
-                model["status"] = "Available"
-            elif model["name"] in installed_models:
-                model["is_available"] = False
-                model["status"] = "Installed (Not Running)"
-            else:
-                model["is_available"] = False
-                model["status"] = "Download Required"
+        logger.info("Ollama running=%d installed=%d", len(running_models), len(installed_models))
         
-        # Sort models alphabetically by display_name
-        all_models.sort(key=lambda x: x["display_name"])
+        # Overlay availability onto copies of the presorted catalog in one pass
+        all_models = []
+        for model in _OPEN_SOURCE_MODELS_SORTED:
+            name = model["name"]
+            is_available, status = (
+                _STATUS_RUNNING if name in running_models
+                else _STATUS_INSTALLED if name in installed_models
+                else _STATUS_DOWNLOAD_REQUIRED
+            )
+            all_models.append({**model, "is_available": is_available, "status": status})
         
         return {
             "models": all_models,
             "available_count": len(running_models),
             "total_count": len(all_models),
-            "categories": sorted(list(set(model["category"] for model in all_models))),
-            "organizations": sorted(list(set(model["organization"] for model in all_models)))
+            "categories": list(_CATEGORIES),
+            "organizations": list(_ORGANIZATIONS)
         }
 
-# Global instance
-model_availability_service = ModelAvailabilityService() 
\ No newline at end of file
+@lru_cache(maxsize=None)
+def get_model_availability_service() -> ModelAvailabilityService:
+    """Get the model availability service, creating it on first use."""
+    return ModelAvailabilityService() 
\ No newline at end of file
@@ -1,76 +1,254 @@
 import asyncio
+import math
 import time
 import datetime
+import string
+import threading
 import uuid
-from typing import List, Dict, Optional
-from app.services.generation_service import GenerationService
+from collections import OrderedDict
+from functools import lru_cache, wraps
+from hashlib import blake2b
+from types import MappingProxyType
+from typing import Any, Callable, List, Dict, FrozenSet, Mapping, NamedTuple, Optional, Tuple
+from app.services.generation_service import generation_service
 from app.services.rag_service import rag_service
 from app.services.input_processor import input_processor
 from app.services.analytics_service import analytics_service
 from app.models.requests import ModelComparisonResult, ModelComparisonResponse
+import numpy as np
 import textstat
 import re
 import logging
 
+# Precompiled tokenizer patterns: sentences are runs of text between periods
+# (without surrounding whitespace); "?" and "!" do not end a sentence
+_SENTENCE_RE = re.compile(r'[^.\s](?:[^.]*[^.\s])?')
+_SENTENCE_END_RE = re.compile(r'\.')
+# Words are whitespace-separated runs after ASCII punctuation is deleted, so
+# "don't" stays one word ("dont") rather than being split at the apostrophe
+_PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+
 # Simple text processing functions to avoid NLTK issues
 def simple_sent_tokenize(text: str) -> List[str]:
     """Simple sentence tokenization without NLTK."""
-    sentences = []
-    # Split on periods and handle cases where text doesn't end with a period
-    parts = text.split('.')
-    for part in parts:
-        part = part.strip()
-        if part:
-            sentences.append(part)
-    return sentences
+    return _SENTENCE_RE.findall(text)
 
 def simple_word_tokenize(text: str) -> List[str]:
     """Simple word tokenization without NLTK."""
-    import string
-    # Remove punctuation and split
-    text = text.translate(str.maketrans('', '', string.punctuation))
-    return text.split()
+    return text.translate(_PUNCTUATION_TABLE).split()
 
 # Common English stop words
-COMMON_STOP_WORDS = {
+COMMON_STOP_WORDS = frozenset({
     'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'he', 
     'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the', 'to', 'was', 'will', 'with',
     'i', 'you', 'your', 'we', 'they', 'them', 'this', 'these', 'those', 'but', 'or',
     'if', 'then', 'else', 'when', 'where', 'why', 'how', 'all', 'any', 'both', 'each',
     'few', 'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not', 'only', 'own',
     'same', 'so', 'than', 'too', 'very', 'can', 'will', 'just', 'should', 'now'
+})
+
+def _text_digest(text: str) -> bytes:
+    """Return a compact, collision-resistant cache key for a text."""
+    return blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+def _lru_cache_by_digest(maxsize: int) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """LRU-cache a function of text arguments, keyed by the digests of the texts.
+    
+    Unlike functools.lru_cache this does not keep the (possibly very long)
+    source texts and summaries alive for as long as their entries are cached.
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        cache: "OrderedDict[Tuple[bytes, ...], Any]" = OrderedDict()
+        lock = threading.Lock()
+        
+        @wraps(func)
+        def wrapper(*texts: str) -> Any:
+            key = tuple(_text_digest(text) for text in texts)
+            with lock:
+                if key in cache:
+                    cache.move_to_end(key)
+                    return cache[key]
+            result = func(*texts)
+            with lock:
+                cache[key] = result
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return result
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+@_lru_cache_by_digest(maxsize=1024)
+def _token_stats(text: str) -> Tuple[int, FrozenSet[str]]:
+    """Return the word count and the relevance keywords of a text.
+    
+    Every model in a comparison is scored against the same source text, so the
+    result is cached instead of re-splitting the text for each one.
+    """
+    # Candidate keywords: alphanumeric words longer than 3 characters
+    words = (word.lower() for word in simple_word_tokenize(text)
+             if word.isalnum() and len(word) > 3)
+    keywords = frozenset(word for word in words if word not in COMMON_STOP_WORDS)
+    return len(text.split()), keywords
+
+def _legacy_round(number: float, points: int) -> float:
+    """Round half away from zero, matching textstat's output rounding."""
+    p = 10 ** points
+    return float(math.floor((number * p) + math.copysign(0.5, number))) / p
+
+# textstat's English syllable threshold for Gunning Fog "complex" words
+_GUNNING_FOG_SYLLABLE_THRESHOLD = 3
+
+def _readability_scores(word_count: int, sentence_count: int, syllable_count: int,
+                        difficult_word_count: int) -> Tuple[float, float, float]:
+    """Return (Flesch reading ease, Flesch-Kincaid grade, Gunning Fog) from precomputed counts.
+    
+    Uses textstat's English formulas and rounding so all three indices can share
+    a single tokenization of the text instead of each re-deriving the averages.
+    """
+    if word_count:
+        sentence_length = _legacy_round(word_count / sentence_count, 1)
+        syllables_per_word = _legacy_round(syllable_count / word_count, 1)
+        gunning_fog = _legacy_round(
+            0.4 * (sentence_length + difficult_word_count / word_count * 100), 2
+        )
+    else:
+        sentence_length = syllables_per_word = 0.0
+        gunning_fog = 0.0
+    reading_ease = 206.835 - (1.015 * sentence_length) - (84.6 * syllables_per_word)
+    grade = (0.39 * sentence_length) + (11.8 * syllables_per_word) - 15.59
+    return _legacy_round(reading_ease, 2), _legacy_round(grade, 1), gunning_fog
+
+# Transition words and phrases used by the coherence score
+TRANSITION_WORDS = (
+    'however', 'therefore', 'furthermore', 'moreover', 'additionally',
+    'consequently', 'thus', 'hence', 'meanwhile', 'nevertheless',
+    'nonetheless', 'in addition', 'on the other hand', 'for example',
+    'in conclusion', 'to summarize', 'in summary'
+)
+# Matches any whole transition word or phrase, in any case, in one scan
+_TRANSITION_RE = re.compile(
+    r'\b(?:' + '|'.join(map(re.escape, TRANSITION_WORDS)) + r')\b', re.IGNORECASE
+)
+
+# Per summary type instructions appended to the summarizer system prompt
+_SUMMARY_PROMPT_INSTRUCTIONS = {
+    "bullet_points": "Format the summary as bullet points highlighting the key information.",
+    "key_points": "Focus on extracting the main ideas and key points from the text.",
+    "extractive": "Use extractive summarization by selecting the most important sentences from the text.",
+    "general": "Provide a comprehensive yet concise summary that captures the main ideas.",
 }
 
+
+class _RecommendationCandidates(NamedTuple):
+    """Best result for each recommendation category, as found by _scan_for_recommendations."""
+    best_quality: ModelComparisonResult
+    fastest: ModelComparisonResult
+    longest: ModelComparisonResult
+    most_compressed: ModelComparisonResult
+    most_coherent: ModelComparisonResult
+    most_relevant: ModelComparisonResult
+    best_balanced: Optional[ModelComparisonResult]
+    cost_efficient: Optional[ModelComparisonResult]
+
+
+def _scan_for_recommendations(results: List[ModelComparisonResult]) -> _RecommendationCandidates:
+    """Find every recommendation candidate in a single pass over non-empty results.
+    
+    Ties go to the earliest result, and missing scores, lengths or latencies never
+    win, matching max()/min() with ``or 0`` / ``or inf`` keys.
+    """
+    best_quality = fastest = longest = most_compressed = most_coherent = most_relevant = results[0]
+    best_quality_score = best_quality.quality_score or 0
+    fastest_latency = fastest.latency_ms or float('inf')
+    longest_length = longest.generated_length or 0
+    most_coherent_score = most_coherent.coherence_score or 0
+    most_relevant_score = most_relevant.relevance_score or 0
+    best_balanced = None
+    cost_efficient = None
+    cost_efficient_tokens = 0
+    
+    for result in results:
+        quality = result.quality_score or 0
+        if quality > best_quality_score:
+            best_quality, best_quality_score = result, quality
+        latency = result.latency_ms or float('inf')
+        if latency < fastest_latency:
+            fastest, fastest_latency = result, latency
+        length = result.generated_length or 0
+        if length > longest_length:
+            longest, longest_length = result, length
+        coherence = result.coherence_score or 0
+        if coherence > most_coherent_score:
+            most_coherent, most_coherent_score = result, coherence
+        relevance = result.relevance_score or 0
+        if relevance > most_relevant_score:
+            most_relevant, most_relevant_score = result, relevance
+        # Only summaries have a compression ratio
+        if (result.compression_ratio is not None and most_compressed.compression_ratio is not None
+                and result.compression_ratio < most_compressed.compression_ratio):
+            most_compressed = result
+        
+        if quality > 0.7:
+            # Balanced: good quality at under 5 seconds
+            if result.latency_ms and result.latency_ms < 5000:
+                if not best_balanced or quality > best_balanced.quality_score:
+                    best_balanced = result
+            # Cost considerations (if token usage is available)
+            if result.token_usage:
+                total_tokens = result.token_usage.get('total_tokens', 0)
+                if cost_efficient is None or total_tokens < cost_efficient_tokens:
+                    cost_efficient, cost_efficient_tokens = result, total_tokens
+    
+    return _RecommendationCandidates(
+        best_quality, fastest, longest, most_compressed,
+        most_coherent, most_relevant, best_balanced, cost_efficient
+    )
+
+
 logger = logging.getLogger(__name__)
 
 class ModelComparisonService:
     def __init__(self):
-        self.generation_service = GenerationService()
+        self.generation_service = generation_service
         self.rag_service = rag_service
     
     def _calculate_quality_metrics(self, original_text: str, summary: str) -> Dict[str, float]:
         """Calculate various quality metrics for the summary."""
+        return dict(self._cached_quality_metrics(original_text, summary))
+    
+    @staticmethod
+    @_lru_cache_by_digest(maxsize=4096)
+    def _cached_quality_metrics(original_text: str, summary: str) -> Mapping[str, float]:
+        """Calculate quality metrics once per (original_text, summary) pair.
+        
+        The result is read-only because it is shared between cache hits.
+        """
         try:
             # Debug logging for GPT OSS issue
             logger.info(f"Calculating quality metrics for summary length: {len(summary)}")
             logger.info(f"Summary preview: {summary[:200]}...")
             
             # Basic metrics
-            original_length = len(original_text.split())
-            summary_length = len(summary.split())
+            original_length = _token_stats(original_text)[0]
+            summary_length = _token_stats(summary)[0]
             compression_ratio = summary_length / original_length if original_length > 0 else 0
             
             # Readability metrics with fallback
             try:
-                flesch_reading_ease = textstat.flesch_reading_ease(summary)
-                flesch_kincaid_grade = textstat.flesch_kincaid_grade(summary)
-                gunning_fog = textstat.gunning_fog(summary)
+                flesch_reading_ease, flesch_kincaid_grade, gunning_fog = _readability_scores(
+                    textstat.lexicon_count(summary),
+                    textstat.sentence_count(summary),
+                    textstat.syllable_count(summary),
+                    textstat.difficult_words(summary, _GUNNING_FOG_SYLLABLE_THRESHOLD),
+                )
             except Exception as e:
                 logger.warning(f"Textstat failed, using fallback readability: {str(e)}")
                 # Fallback readability calculation
                 words = summary.split()
                 sentences = simple_sent_tokenize(summary)
-                syllables = self._estimate_syllables(summary)
+                syllables = ModelComparisonService._estimate_syllables(summary)
                 
                 if words and sentences:
                     avg_sentence_length = len(words) / len(sentences)
@@ -83,15 +261,15 @@ class ModelComparisonService:
                 gunning_fog = max(0, min(20, 0.4 * (avg_sentence_length + (100 * avg_syllables_per_word / len(words))))) if words and sentences else 10.0
             
             # Coherence score (based on sentence flow)
-            coherence_score = self._calculate_coherence_score(summary)
+            coherence_score = ModelComparisonService._calculate_coherence_score(summary)
             logger.info(f"Raw coherence score: {coherence_score}")
             
             # Relevance score (based on keyword overlap)
-            relevance_score = self._calculate_relevance_score(original_text, summary)
+            relevance_score = ModelComparisonService._calculate_relevance_score(original_text, summary)
             logger.info(f"Raw relevance score: {relevance_score}")
             
             # Overall quality score (weighted combination)
-            quality_score = self._calculate_overall_quality_score(
+            quality_score = ModelComparisonService._calculate_overall_quality_score(
                 compression_ratio, coherence_score, relevance_score, flesch_reading_ease
             )
             
@@ -99,7 +277,7 @@ class ModelComparisonService:
             logger.info(f"Quality metrics calculated - Quality: {quality_score:.3f}, Coherence: {coherence_score:.3f}, Relevance: {relevance_score:.3f}")
             logger.info(f"Final coherence score (percentage): {coherence_score * 100}")
             
-            return {
+            return MappingProxyType({
                 "quality_score": quality_score * 100,  # Convert to percentage
                 "coherence_score": coherence_score * 100,  # Convert to percentage
                 "relevance_score": relevance_score * 100,  # Convert to percentage
@@ -109,11 +287,11 @@ class ModelComparisonService:
                 "gunning_fog": gunning_fog,
                 "original_length": original_length,
                 "summary_length": summary_length
-            }
+            })
             
         except Exception as e:
             logger.error(f"Error calculating quality metrics: {str(e)}")
-            return {
+            return MappingProxyType({
                 "quality_score": 0.0,  # Already 0, no need to multiply
                 "coherence_score": 0.0,  # Already 0, no need to multiply
                 "relevance_score": 0.0,  # Already 0, no need to multiply
@@ -121,11 +299,12 @@ class ModelComparisonService:
                 "flesch_reading_ease": 0.0,
                 "flesch_kincaid_grade": 0.0,
                 "gunning_fog": 0.0,
-                "original_length": len(original_text.split()),
-                "summary_length": len(summary.split())
-            }
+                "original_length": _token_stats(original_text)[0],
+                "summary_length": _token_stats(summary)[0]
+            })
     
-    def _estimate_syllables(self, text: str) -> int:
+    @staticmethod
+    def _estimate_syllables(text: str) -> int:
         """Estimate syllable count for readability calculations."""
         try:
             # Simple syllable estimation
@@ -150,9 +329,15 @@ class ModelComparisonService:
         except Exception:
             return len(text.split())  # Fallback to word count
     
-    def _calculate_coherence_score(self, summary: str) -> float:
+    @staticmethod
+    @_lru_cache_by_digest(maxsize=4096)
+    def _calculate_coherence_score(summary: str) -> float:
         """Calculate coherence score based on sentence flow and transitions."""
         try:
+            # Without a period there is at most one sentence
+            if not _SENTENCE_END_RE.search(summary):
+                return 0.8
+            
             # Use simple sentence tokenization
             sentences = simple_sent_tokenize(summary)
             
@@ -160,30 +345,18 @@ class ModelComparisonService:
                 return 0.8  # Single sentence gets good coherence score
             
             # Check for transition words
-            transition_words = [
-                'however', 'therefore', 'furthermore', 'moreover', 'additionally',
-                'consequently', 'thus', 'hence', 'meanwhile', 'nevertheless',
-                'nonetheless', 'in addition', 'on the other hand', 'for example',
-                'in conclusion', 'to summarize', 'in summary'
-            ]
-            
-            transition_count = 0
-            for sentence in sentences:
-                sentence_lower = sentence.lower()
-                for word in transition_words:
-                    if word in sentence_lower:
-                        transition_count += 1
-                        break
+            transition_count = sum(1 for sentence in sentences
+                                   if _TRANSITION_RE.search(sentence))
             
             # Calculate coherence based on transitions and sentence length consistency
             # Give a base score even without transitions
             transition_score = max(0.3, min(transition_count / len(sentences), 1.0))
             
             # Check sentence length consistency
-            sentence_lengths = [len(sent.split()) for sent in sentences]
-            if sentence_lengths:
-                avg_length = sum(sentence_lengths) / len(sentence_lengths)
-                length_variance = sum((length - avg_length)**2 for length in sentence_lengths) / len(sentence_lengths)
+            sentence_lengths = np.fromiter((len(sent.split()) for sent in sentences),
+                                           dtype=np.int32, count=len(sentences))
+            if sentence_lengths.size:
+                length_variance = float(sentence_lengths.var())
                 consistency_score = max(0.4, 1 - (length_variance / 100))  # Normalize variance with minimum
             else:
                 consistency_score = 0.6
@@ -196,24 +369,23 @@ class ModelComparisonService:
             logger.error(f"Error calculating coherence score: {str(e)}")
             return 0.6  # Better fallback score
     
-    def _calculate_relevance_score(self, original_text: str, summary: str) -> float:
+    @staticmethod
+    @_lru_cache_by_digest(maxsize=4096)
+    def _calculate_relevance_score(original_text: str, summary: str) -> float:
         """Calculate relevance score based on keyword overlap."""
         try:
-            # Use simple word tokenization
-            original_words = set(word.lower() for word in simple_word_tokenize(original_text) 
-                               if word.isalnum() and len(word) > 3)
-            summary_words = set(word.lower() for word in simple_word_tokenize(summary) 
-                              if word.isalnum() and len(word) > 3)
+            if not original_text:
+                return 0.6  # No keywords to match against
             
-            # Remove common stop words using our predefined set
-            original_keywords = original_words - COMMON_STOP_WORDS
-            summary_keywords = summary_words - COMMON_STOP_WORDS
+            # Keywords with common stop words already removed
+            original_keywords = _token_stats(original_text)[1]
+            summary_keywords = _token_stats(summary)[1]
             
             if not original_keywords:
                 return 0.6  # Better fallback score
             
             # Calculate overlap
-            overlap = len(original_keywords.intersection(summary_keywords))
+            overlap = len(original_keywords & summary_keywords)
             relevance_score = overlap / len(original_keywords)
             
             # Give a minimum score and boost the score
@@ -226,7 +398,8 @@ class ModelComparisonService:
             logger.error(f"Error calculating relevance score: {str(e)}")
             return 0.6  # Better fallback score
     
-    def _calculate_overall_quality_score(self, compression_ratio: float, coherence_score: float, 
+    @staticmethod
+    def _calculate_overall_quality_score(compression_ratio: float, coherence_score: float, 
                                        relevance_score: float, readability_score: float) -> float:
         """Calculate overall quality score using weighted metrics."""
         try:
@@ -268,49 +441,74 @@ class ModelComparisonService:
             logger.error(f"Error calculating overall quality score: {str(e)}")
             return 0.6  # Better fallback score
     
+    async def _gather_bounded(self, coros: List, max_concurrency: int) -> List:
+        """Await coroutines concurrently with at most ``max_concurrency`` in flight.
+        
+        Keeps large comparisons from exhausting connection pools or tripping
+        provider rate limits. Exceptions are returned in place of results.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def bounded(coro):
+            try:
+                async with semaphore:
+                    return await coro
+            finally:
+                # Release coroutines that were cancelled before they started
+                coro.close()
+        
+        return await asyncio.gather(*(bounded(coro) for coro in coros), return_exceptions=True)
+    
     async def compare_models(self, text: str, models: List[dict], max_length: int = 150,
-                           temperature: float = 0.3, summary_type: str = "general") -> ModelComparisonResponse:
+                           temperature: float = 0.3, summary_type: str = "general",
+                           max_concurrency: int = 8) -> ModelComparisonResponse:
         """Compare multiple models for text summarization."""
-        start_time = time.time()
         comparison_id = str(uuid.uuid4())
+        # One timestamp for the whole comparison and every result in it
+        timestamp = datetime.datetime.utcnow().isoformat()
         
         try:
             # Process input text (no processing needed for plain text)
             processed_text = text
             
+            # Tokenize the shared source text once for every model's metrics
+            original_stats = _token_stats(processed_text)
+            
             # Generate summaries with all models concurrently
             tasks = []
             for model_config in models:
                 task = self._generate_summary_with_model(
-                    processed_text, model_config, max_length, temperature, summary_type
+                    processed_text, model_config, max_length, temperature, summary_type, timestamp,
+                    original_stats
                 )
                 tasks.append(task)
             
             # Wait for all summaries to complete
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            results = await self._gather_bounded(tasks, max_concurrency)
             
             # Process results and calculate metrics
-            comparison_results = []
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error(f"Error with model {models[i]}: {str(result)}")
-                    # Create error result
-                    comparison_results.append(ModelComparisonResult(
-                        model_provider=models[i].get("provider", "unknown"),
-                        model_name=models[i].get("model", "unknown"),
-                        summary=f"Error: {str(result)}",
-                        original_length=len(processed_text.split()),
-                        summary_length=0,
-                        compression_ratio=0.0,
-                        token_usage=None,
-                        latency_ms=None,
-                        quality_score=0.0,
-                        coherence_score=0.0,
-                        relevance_score=0.0,
-                        timestamp=datetime.datetime.utcnow().isoformat()
-                    ))
-                else:
-                    comparison_results.append(result)
+            model_ids = [(m.get("provider", "unknown"), m.get("model", "unknown")) for m in models]
+            # Successful results stay in place; only failures need a placeholder
+            comparison_results = list(results)
+            failed = [i for i, result in enumerate(results) if isinstance(result, Exception)]
+            for i in failed:
+                result = results[i]
+                logger.error(f"Error with model {models[i]}: {str(result)}")
+                provider, model_name = model_ids[i]
+                comparison_results[i] = ModelComparisonResult(
+                    model_provider=provider,
+                    model_name=model_name,
+                    summary=f"Error: {str(result)}",
+                    original_length=original_stats[0],
+                    summary_length=0,
+                    compression_ratio=0.0,
+                    token_usage=None,
+                    latency_ms=None,
+                    quality_score=0.0,
+                    coherence_score=0.0,
+                    relevance_score=0.0,
+                    timestamp=timestamp
+                )
             
             # Calculate comparison metrics
             comparison_metrics = self._calculate_comparison_metrics(comparison_results)
@@ -318,15 +516,13 @@ class ModelComparisonService:
             # Generate recommendations
             recommendations = self._generate_recommendations(comparison_results, comparison_metrics)
             
-            total_time = (time.time() - start_time) * 1000
-            
             return ModelComparisonResponse(
                 comparison_id=comparison_id,
                 original_text=processed_text,
                 results=comparison_results,
                 comparison_metrics=comparison_metrics,
                 recommendations=recommendations,
-                timestamp=datetime.datetime.utcnow().isoformat()
+                timestamp=timestamp
             )
             
         except Exception as e:
@@ -336,45 +532,49 @@ class ModelComparisonService:
     async def compare_generation_models(self, system_prompt: str, user_prompt: str, models: List[dict], 
                                       temperature: float = 0.7, max_tokens: Optional[int] = None,
                                       target_language: str = "en", translate_response: bool = False,
-                                      output_format: str = "text") -> ModelComparisonResponse:
+                                      output_format: str = "text",
+                                      max_concurrency: int = 8) -> ModelComparisonResponse:
         """Compare multiple models for text generation."""
-        start_time = time.time()
         comparison_id = str(uuid.uuid4())
         
         try:
+            # Tokenize the shared user prompt once for every model's metrics
+            original_stats = _token_stats(user_prompt)
+            
             # Generate text with all models concurrently
             tasks = []
             for model_config in models:
                 task = self._generate_text_with_model(
                     system_prompt, user_prompt, model_config, temperature, max_tokens,
-                    target_language, translate_response, output_format
+                    target_language, translate_response, output_format, original_stats
                 )
                 tasks.append(task)
             
             # Wait for all generations to complete
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            results = await self._gather_bounded(tasks, max_concurrency)
             
             # Process results and calculate metrics
-            comparison_results = []
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error(f"Error with model {models[i]}: {str(result)}")
-                    # Create error result
-                    comparison_results.append(ModelComparisonResult(
-                        model_provider=models[i].get("provider", "unknown"),
-                        model_name=models[i].get("model", "unknown"),
-                        generated_text=f"Error: {str(result)}",
-                        original_length=len(user_prompt.split()),
-                        generated_length=0,
-                        token_usage=None,
-                        latency_ms=None,
-                        quality_score=0.0,
-                        coherence_score=0.0,
-                        relevance_score=0.0,
-                        timestamp=datetime.datetime.utcnow().isoformat()
-                    ))
-                else:
-                    comparison_results.append(result)
+            model_ids = [(m.get("provider", "unknown"), m.get("model", "unknown")) for m in models]
+            # Successful results stay in place; only failures need a placeholder
+            comparison_results = list(results)
+            failed = [i for i, result in enumerate(results) if isinstance(result, Exception)]
+            for i in failed:
+                result = results[i]
+                logger.error(f"Error with model {models[i]}: {str(result)}")
+                provider, model_name = model_ids[i]
+                comparison_results[i] = ModelComparisonResult(
+                    model_provider=provider,
+                    model_name=model_name,
+                    generated_text=f"Error: {str(result)}",
+                    original_length=original_stats[0],
+                    generated_length=0,
+                    token_usage=None,
+                    latency_ms=None,
+                    quality_score=0.0,
+                    coherence_score=0.0,
+                    relevance_score=0.0,
+                    timestamp=datetime.datetime.utcnow().isoformat()
+                )
             
             # Calculate comparison metrics
             comparison_metrics = self._calculate_generation_comparison_metrics(comparison_results)
@@ -382,8 +582,6 @@ class ModelComparisonService:
             # Generate recommendations
             recommendations = self._generate_generation_recommendations(comparison_results, comparison_metrics)
             
-            total_time = (time.time() - start_time) * 1000
-            
             return ModelComparisonResponse(
                 comparison_id=comparison_id,
                 original_text=user_prompt,
@@ -400,9 +598,9 @@ class ModelComparisonService:
     async def compare_rag_models(self, question: str, collection_names: List[str], models: List[dict],
                                 temperature: float = 0.7, max_tokens: Optional[int] = None,
                                 top_k: int = 5, similarity_threshold: float = -0.2,
-                                filter_tags: List[str] = None) -> ModelComparisonResponse:
+                                filter_tags: List[str] = None,
+                                max_concurrency: int = 8) -> ModelComparisonResponse:
         """Compare multiple models for RAG question answering."""
-        start_time = time.time()
         comparison_id = str(uuid.uuid4())
         
         try:
@@ -416,29 +614,31 @@ class ModelComparisonService:
                 tasks.append(task)
             
             # Wait for all generations to complete
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            results = await self._gather_bounded(tasks, max_concurrency)
             
             # Process results and calculate metrics
-            comparison_results = []
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error(f"Error with model {models[i]}: {str(result)}")
-                    # Create error result
-                    comparison_results.append(ModelComparisonResult(
-                        model_provider=models[i].get("provider", "unknown"),
-                        model_name=models[i].get("model", "unknown"),
-                        generated_text=f"Error: {str(result)}",
-                        original_length=len(question.split()),
-                        generated_length=0,
-                        token_usage=None,
-                        latency_ms=None,
-                        quality_score=0.0,
-                        coherence_score=0.0,
-                        relevance_score=0.0,
-                        timestamp=datetime.datetime.utcnow().isoformat()
-                    ))
-                else:
-                    comparison_results.append(result)
+            question_length = _token_stats(question)[0]
+            model_ids = [(m.get("provider", "unknown"), m.get("model", "unknown")) for m in models]
+            # Successful results stay in place; only failures need a placeholder
+            comparison_results = list(results)
+            failed = [i for i, result in enumerate(results) if isinstance(result, Exception)]
+            for i in failed:
+                result = results[i]
+                logger.error(f"Error with model {models[i]}: {str(result)}")
+                provider, model_name = model_ids[i]
+                comparison_results[i] = ModelComparisonResult(
+                    model_provider=provider,
+                    model_name=model_name,
+                    generated_text=f"Error: {str(result)}",
+                    original_length=question_length,
+                    generated_length=0,
+                    token_usage=None,
+                    latency_ms=None,
+                    quality_score=0.0,
+                    coherence_score=0.0,
+                    relevance_score=0.0,
+                    timestamp=datetime.datetime.utcnow().isoformat()
+                )
             
             # Calculate comparison metrics
             comparison_metrics = self._calculate_rag_comparison_metrics(comparison_results)
@@ -446,8 +646,6 @@ class ModelComparisonService:
             # Generate recommendations
             recommendations = self._generate_rag_recommendations(comparison_results, comparison_metrics)
             
-            total_time = (time.time() - start_time) * 1000
-            
             return ModelComparisonResponse(
                 comparison_id=comparison_id,
                 original_text=question,
@@ -463,7 +661,8 @@ class ModelComparisonService:
 
     async def _generate_summary_with_model(self, text: str, model_config: dict, 
                                          max_length: int, temperature: float, 
-                                         summary_type: str) -> ModelComparisonResult:
+                                         summary_type: str, timestamp: str,
+                                         original_stats: Optional[Tuple[int, FrozenSet[str]]] = None) -> ModelComparisonResult:
         """Generate summary with a specific model and calculate metrics."""
         start_time = time.time()
         
@@ -474,8 +673,8 @@ class ModelComparisonService:
             # Create system prompt based on summary type
             system_prompt = self._create_summary_prompt(summary_type, max_length)
             
-            # Generate summary
-            full_content = ""
+            # Generate summary, collecting chunks and joining them once at the end
+            chunks: List[str] = []
             token_usage = None
             latency_ms = 0
             
@@ -496,7 +695,7 @@ class ModelComparisonService:
                 
                 # Handle both dictionary and object formats
                 if isinstance(chunk, dict):
-                    full_content += chunk.get("content", "")
+                    chunks.append(chunk.get("content", ""))
                     # Only update values if they exist (final chunk)
                     if chunk.get("token_usage") is not None:
                         token_usage = chunk.get("token_usage")
@@ -505,7 +704,7 @@ class ModelComparisonService:
                         latency_ms = chunk.get("latency_ms")
                 else:
                     # Handle object format (fallback)
-                    full_content += getattr(chunk, 'content', '')
+                    chunks.append(getattr(chunk, 'content', ''))
                     # Only update values if they exist (final chunk)
                     if hasattr(chunk, 'token_usage') and chunk.token_usage is not None:
                         token_usage = chunk.token_usage
@@ -513,27 +712,35 @@ class ModelComparisonService:
                     if hasattr(chunk, 'latency_ms') and chunk.latency_ms is not None:
                         latency_ms = chunk.latency_ms
             
+            full_content = "".join(chunks)
+            
             # Debug logging for generated content
             logger.info(f"Generated content length: {len(full_content)}")
             logger.info(f"Generated content preview: {full_content[:200]}...")
             
             # Post-process to ensure summary is not longer than original
-            summary_words = full_content.split()
-            original_words = text.split()
+            if original_stats is None:
+                original_stats = _token_stats(text)
+            original_length = original_stats[0]
+            summary_length = _token_stats(full_content)[0]
             
-            if len(summary_words) > len(original_words):
-                logger.warning(f"Summary ({len(summary_words)} words) is longer than original ({len(original_words)} words). Truncating.")
+            if summary_length > original_length:
+                logger.warning(f"Summary ({summary_length} words) is longer than original ({original_length} words). Truncating.")
                 # Truncate to 80% of original length
-                max_summary_words = int(len(original_words) * 0.8)
-                full_content = ' '.join(summary_words[:max_summary_words])
-                logger.info(f"Truncated summary to {len(full_content.split())} words")
-            
-            # Calculate quality metrics
-            quality_metrics = self._calculate_quality_metrics(text, full_content)
+                max_summary_words = int(original_length * 0.8)
+                full_content = ' '.join(full_content.split()[:max_summary_words])
+                summary_length = _token_stats(full_content)[0]
+                logger.info(f"Truncated summary to {summary_length} words")
+            
+            # Calculate quality metrics in a worker thread so this model's scoring
+            # overlaps with the other models that are still streaming. The shared
+            # original_stats came from the cached _token_stats, so the reference
+            # text is not re-tokenized here
+            quality_metrics = await asyncio.to_thread(
+                self._calculate_quality_metrics, text, full_content
+            )
             
             # Calculate compression ratio
-            original_length = len(text.split())
-            summary_length = len(full_content.split())
             compression_ratio = summary_length / original_length if original_length > 0 else 0
             
             # Debug logging for final metrics
@@ -544,7 +751,8 @@ class ModelComparisonService:
             logger.info(f"  - Token usage: {token_usage}")
             logger.info(f"  - Latency: {latency_ms}ms")
             
-            return ModelComparisonResult(
+            # Values are produced by this service, so skip per-field validation
+            return ModelComparisonResult.model_construct(
                 model_provider=model_config["provider"],
                 model_name=model_config["model"],
                 summary=full_content,
@@ -556,7 +764,7 @@ class ModelComparisonService:
                 quality_score=quality_metrics["quality_score"],
                 coherence_score=quality_metrics["coherence_score"],
                 relevance_score=quality_metrics["relevance_score"],
-                timestamp=datetime.datetime.utcnow().isoformat()
+                timestamp=timestamp
             )
             
         except Exception as e:
@@ -566,13 +774,12 @@ class ModelComparisonService:
     async def _generate_text_with_model(self, system_prompt: str, user_prompt: str, model_config: dict,
                                       temperature: float, max_tokens: Optional[int],
                                       target_language: str, translate_response: bool,
-                                      output_format: str) -> ModelComparisonResult:
+                                      output_format: str,
+                                      original_stats: Optional[Tuple[int, FrozenSet[str]]] = None) -> ModelComparisonResult:
         """Generate text with a specific model and calculate metrics."""
-        start_time = time.time()
-        
         try:
-            # Generate text
-            full_content = ""
+            # Generate text, collecting chunks and joining them once at the end
+            chunks: List[str] = []
             token_usage = None
             latency_ms = 0
             
@@ -589,7 +796,7 @@ class ModelComparisonService:
             ):
                 # Handle both dictionary and object formats
                 if isinstance(chunk, dict):
-                    full_content += chunk.get("content", "")
+                    chunks.append(chunk.get("content", ""))
                     # Only update token_usage and latency_ms if they exist (final chunk)
                     if chunk.get("token_usage") is not None:
                         token_usage = chunk.get("token_usage")
@@ -597,21 +804,26 @@ class ModelComparisonService:
                         latency_ms = chunk.get("latency_ms")
                 else:
                     # Handle object format (fallback)
-                    full_content += getattr(chunk, 'content', '')
+                    chunks.append(getattr(chunk, 'content', ''))
                     # Only update token_usage and latency_ms if they exist (final chunk)
                     if hasattr(chunk, 'token_usage') and chunk.token_usage is not None:
                         token_usage = chunk.token_usage
                     if hasattr(chunk, 'latency_ms') and chunk.latency_ms is not None:
                         latency_ms = chunk.latency_ms
             
+            full_content = "".join(chunks)
+            
             # Calculate quality metrics (using user prompt as reference)
-            quality_metrics = self._calculate_quality_metrics(user_prompt, full_content)
+            quality_metrics = await asyncio.to_thread(
+                self._calculate_quality_metrics, user_prompt, full_content
+            )
             
-            # Calculate generation length
-            generated_length = len(full_content.split())
-            original_length = len(user_prompt.split())
+            # Generation lengths were already counted while scoring
+            generated_length = quality_metrics["summary_length"]
+            original_length = quality_metrics["original_length"]
             
-            return ModelComparisonResult(
+            # Values are produced by this service, so skip per-field validation
+            return ModelComparisonResult.model_construct(
                 model_provider=model_config["provider"],
                 model_name=model_config["model"],
                 generated_text=full_content,
@@ -637,8 +849,8 @@ class ModelComparisonService:
         start_time = time.time()
         
         try:
-            # Generate answer using RAG service
-            full_content = ""
+            # Generate answer using RAG service, collecting chunks and joining them once at the end
+            chunks: List[str] = []
             token_usage = None
             latency_ms = 0
             sources = []
@@ -657,7 +869,7 @@ class ModelComparisonService:
             ):
                 # Handle dictionary format from RAG service
                 if isinstance(chunk, dict):
-                    full_content += chunk.get("content", "")
+                    chunks.append(chunk.get("content", ""))
                     # Only update values if they exist (final chunk)
                     if chunk.get("latency_ms") is not None:
                         latency_ms = chunk.get("latency_ms")
@@ -669,7 +881,7 @@ class ModelComparisonService:
                         token_usage = chunk.get("token_usage")
                 else:
                     # Handle object format (fallback)
-                    full_content += getattr(chunk, 'content', '')
+                    chunks.append(getattr(chunk, 'content', ''))
                     # Only update values if they exist (final chunk)
                     if hasattr(chunk, 'token_usage') and chunk.token_usage is not None:
                         token_usage = chunk.token_usage
@@ -680,17 +892,20 @@ class ModelComparisonService:
                     if hasattr(chunk, 'confidence') and chunk.confidence is not None:
                         confidence = chunk.confidence
             
+            full_content = "".join(chunks)
+            
             # Calculate quality metrics
             quality_metrics = self._calculate_rag_quality_metrics(question, full_content, sources, confidence)
             
             latency_ms = (time.time() - start_time) * 1000
             
-            return ModelComparisonResult(
+            # Values are produced by this service, so skip per-field validation
+            return ModelComparisonResult.model_construct(
                 model_provider=model_config["provider"],
                 model_name=model_config["model"],
                 generated_text=full_content,
-                original_length=len(question.split()),
-                generated_length=len(full_content.split()),
+                original_length=_token_stats(question)[0],
+                generated_length=_token_stats(full_content)[0],
                 token_usage=token_usage.dict() if hasattr(token_usage, 'dict') else token_usage,
                 latency_ms=latency_ms,
                 quality_score=quality_metrics["overall_score"],
@@ -703,48 +918,57 @@ class ModelComparisonService:
             logger.error(f"Error generating RAG answer with model {model_config}: {str(e)}")
             raise e
 
-    def _create_summary_prompt(self, summary_type: str, max_length: int) -> str:
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _create_summary_prompt(summary_type: str, max_length: int) -> str:
         """Create appropriate system prompt based on summary type."""
         base_prompt = f"""You are a professional summarizer. Create a concise summary of the following text in EXACTLY {max_length} words or fewer. 
 
 IMPORTANT: Your summary MUST be shorter than the original text. Do not exceed {max_length} words under any circumstances."""
         
-        if summary_type == "bullet_points":
-            return base_prompt + " Format the summary as bullet points highlighting the key information."
-        elif summary_type == "key_points":
-            return base_prompt + " Focus on extracting the main ideas and key points from the text."
-        elif summary_type == "extractive":
-            return base_prompt + " Use extractive summarization by selecting the most important sentences from the text."
-        else:  # general
-            return base_prompt + " Provide a comprehensive yet concise summary that captures the main ideas."
+        instructions = _SUMMARY_PROMPT_INSTRUCTIONS.get(summary_type, _SUMMARY_PROMPT_INSTRUCTIONS["general"])
+        return f"{base_prompt} {instructions}"
     
     def _calculate_comparison_metrics(self, results: List[ModelComparisonResult]) -> Dict:
         """Calculate overall comparison metrics."""
         if not results:
             return {}
         
-        # Calculate averages
-        avg_latency = sum(r.latency_ms or 0 for r in results) / len(results)
-        avg_quality = sum(r.quality_score or 0 for r in results) / len(results)
-        avg_coherence = sum(r.coherence_score or 0 for r in results) / len(results)
-        avg_relevance = sum(r.relevance_score or 0 for r in results) / len(results)
-        avg_compression = sum(r.compression_ratio or 0 for r in results) / len(results)
+        # Accumulate totals and find best performers in a single pass
+        total_latency = total_quality = total_coherence = total_relevance = total_compression = 0
+        best_quality = fastest = most_compressed = results[0]
+        best_quality_score = best_quality.quality_score or 0
+        fastest_latency = fastest.latency_ms or float('inf')
+        lowest_compression = most_compressed.compression_ratio or float('inf')
         
-        # Find best performers
-        best_quality = max(results, key=lambda x: x.quality_score or 0)
-        fastest = min(results, key=lambda x: x.latency_ms or float('inf'))
-        most_compressed = min(results, key=lambda x: x.compression_ratio or float('inf'))
+        for r in results:
+            quality = r.quality_score or 0
+            total_latency += r.latency_ms or 0
+            total_quality += quality
+            total_coherence += r.coherence_score or 0
+            total_relevance += r.relevance_score or 0
+            total_compression += r.compression_ratio or 0
+            
+            if quality > best_quality_score:
+                best_quality, best_quality_score = r, quality
+            latency = r.latency_ms or float('inf')
+            if latency < fastest_latency:
+                fastest, fastest_latency = r, latency
+            compression = r.compression_ratio or float('inf')
+            if compression < lowest_compression:
+                most_compressed, lowest_compression = r, compression
         
+        count = len(results)
         return {
-            "average_latency_ms": avg_latency,
-            "average_quality_score": avg_quality,
-            "average_coherence_score": avg_coherence,
-            "average_relevance_score": avg_relevance,
-            "average_compression_ratio": avg_compression,
+            "average_latency_ms": total_latency / count,
+            "average_quality_score": total_quality / count,
+            "average_coherence_score": total_coherence / count,
+            "average_relevance_score": total_relevance / count,
+            "average_compression_ratio": total_compression / count,
             "best_quality_model": f"{best_quality.model_provider}/{best_quality.model_name}",
             "fastest_model": f"{fastest.model_provider}/{fastest.model_name}",
             "most_compressed_model": f"{most_compressed.model_provider}/{most_compressed.model_name}",
-            "total_models": len(results)
+            "total_models": count
         }
 
     def _calculate_generation_comparison_metrics(self, results: List[ModelComparisonResult]) -> Dict:
@@ -752,28 +976,41 @@ IMPORTANT: Your summary MUST be shorter than the original text. Do not exceed {m
         if not results:
             return {}
         
-        # Calculate averages
-        avg_latency = sum(r.latency_ms or 0 for r in results) / len(results)
-        avg_quality = sum(r.quality_score or 0 for r in results) / len(results)
-        avg_coherence = sum(r.coherence_score or 0 for r in results) / len(results)
-        avg_relevance = sum(r.relevance_score or 0 for r in results) / len(results)
-        avg_length = sum(r.generated_length or 0 for r in results) / len(results)
+        # Accumulate totals and find best performers in a single pass
+        total_latency = total_quality = total_coherence = total_relevance = total_length = 0
+        best_quality = fastest = longest = results[0]
+        best_quality_score = best_quality.quality_score or 0
+        fastest_latency = fastest.latency_ms or float('inf')
+        longest_length = longest.generated_length or 0
         
-        # Find best performers
-        best_quality = max(results, key=lambda x: x.quality_score or 0)
-        fastest = min(results, key=lambda x: x.latency_ms or float('inf'))
-        longest = max(results, key=lambda x: x.generated_length or 0)
+        for r in results:
+            quality = r.quality_score or 0
+            length = r.generated_length or 0
+            total_latency += r.latency_ms or 0
+            total_quality += quality
+            total_coherence += r.coherence_score or 0
+            total_relevance += r.relevance_score or 0
+            total_length += length
+            
+            if quality > best_quality_score:
+                best_quality, best_quality_score = r, quality
+            latency = r.latency_ms or float('inf')
+            if latency < fastest_latency:
+                fastest, fastest_latency = r, latency
+            if length > longest_length:
+                longest, longest_length = r, length
         
+        count = len(results)
         return {
-            "average_latency_ms": avg_latency,
-            "average_quality_score": avg_quality,
-            "average_coherence_score": avg_coherence,
-            "average_relevance_score": avg_relevance,
-            "average_generated_length": avg_length,
+            "average_latency_ms": total_latency / count,
+            "average_quality_score": total_quality / count,
+            "average_coherence_score": total_coherence / count,
+            "average_relevance_score": total_relevance / count,
+            "average_generated_length": total_length / count,
             "best_quality_model": f"{best_quality.model_provider}/{best_quality.model_name}",
             "fastest_model": f"{fastest.model_provider}/{fastest.model_name}",
             "longest_output_model": f"{longest.model_provider}/{longest.model_name}",
-            "total_models": len(results)
+            "total_models": count
         }
 
     def _calculate_rag_quality_metrics(self, question: str, answer: str, sources: List[dict], 
@@ -788,8 +1025,15 @@ IMPORTANT: Your summary MUST be shorter than the original text. Do not exceed {m
         # Calculate source quality score
         source_quality_score = 0.0
         if sources:
-            avg_similarity = sum(s.get('similarity_score', 0.0) for s in sources) / len(sources)
-            source_diversity = len(set(s.get('document_id', '') for s in sources)) / len(sources)
+            # Accumulate similarity and distinct documents in one pass over the sources
+            total_similarity = 0.0
+            document_ids = set()
+            for source in sources:
+                total_similarity += source.get('similarity_score', 0.0)
+                document_ids.add(source.get('document_id', ''))
+            source_count = len(sources)
+            avg_similarity = total_similarity / source_count
+            source_diversity = len(document_ids) / source_count
             source_quality_score = (avg_similarity + source_diversity) / 2
         
         # Calculate confidence score
@@ -818,18 +1062,33 @@ IMPORTANT: Your summary MUST be shorter than the original text. Do not exceed {m
         if not results:
             return {}
         
-        # Calculate averages
-        avg_quality = sum(r.quality_score for r in results) / len(results)
-        avg_coherence = sum(r.coherence_score for r in results) / len(results)
-        avg_relevance = sum(r.relevance_score for r in results) / len(results)
-        avg_latency = sum(r.latency_ms or 0 for r in results) / len(results)
-        avg_length = sum(r.generated_length for r in results) / len(results)
+        # Accumulate averages and track the best performers in a single pass
+        best_quality = fastest = most_coherent = most_relevant = results[0]
+        fastest_latency = fastest.latency_ms or float('inf')
+        total_quality = total_coherence = total_relevance = total_latency = total_length = 0
+        for r in results:
+            total_quality += r.quality_score
+            total_coherence += r.coherence_score
+            total_relevance += r.relevance_score
+            total_latency += r.latency_ms or 0
+            total_length += r.generated_length
+            
+            if r.quality_score > best_quality.quality_score:
+                best_quality = r
+            latency = r.latency_ms or float('inf')
+            if latency < fastest_latency:
+                fastest, fastest_latency = r, latency
+            if r.coherence_score > most_coherent.coherence_score:
+                most_coherent = r
+            if r.relevance_score > most_relevant.relevance_score:
+                most_relevant = r
         
-        # Find best performers
-        best_quality = max(results, key=lambda x: x.quality_score)
-        fastest = min(results, key=lambda x: x.latency_ms or float('inf'))
-        most_coherent = max(results, key=lambda x: x.coherence_score)
-        most_relevant = max(results, key=lambda x: x.relevance_score)
+        count = len(results)
+        avg_quality = total_quality / count
+        avg_coherence = total_coherence / count
+        avg_relevance = total_relevance / count
+        avg_latency = total_latency / count
+        avg_length = total_length / count
         
         return {
             "average_quality": round(avg_quality, 3),
@@ -841,7 +1100,7 @@ IMPORTANT: Your summary MUST be shorter than the original text. Do not exceed {m
             "fastest_model": f"{fastest.model_provider}/{fastest.model_name}",
             "most_coherent_model": f"{most_coherent.model_provider}/{most_coherent.model_name}",
             "most_relevant_model": f"{most_relevant.model_provider}/{most_relevant.model_name}",
-            "total_models": len(results)
+            "total_models": count
         }
 
     def _generate_recommendations(self, results: List[ModelComparisonResult], 
@@ -853,35 +1112,25 @@ IMPORTANT: Your summary MUST be shorter than the original text. Do not exceed {m
             if not results:
                 return ["No models were successfully compared."]
             
+            best_quality, fastest, _, most_compressed, _, _, best_balanced, cost_efficient = \
+                _scan_for_recommendations(results)
+            
             # Quality recommendations
-            best_quality = max(results, key=lambda x: x.quality_score or 0)
             if best_quality.quality_score and best_quality.quality_score > 0.8:
                 recommendations.append(f"🎯 **{best_quality.model_provider}/{best_quality.model_name}** provides the highest quality summary.")
             
             # Speed recommendations
-            fastest = min(results, key=lambda x: x.latency_ms or float('inf'))
             if fastest.latency_ms and fastest.latency_ms < 2000:  # Less than 2 seconds
                 recommendations.append(f"⚡ **{fastest.model_provider}/{fastest.model_name}** is the fastest option.")
             
             # Compression recommendations
-            most_compressed = min(results, key=lambda x: x.compression_ratio)
             if most_compressed.compression_ratio < 0.2:
                 recommendations.append(f"📝 **{most_compressed.model_provider}/{most_compressed.model_name}** provides the most concise summary.")
             
             # Balanced recommendations
-            balanced_models = [r for r in results if r.quality_score and r.quality_score > 0.7 and 
-                             r.latency_ms and r.latency_ms < 5000]
-            if balanced_models:
-                best_balanced = max(balanced_models, key=lambda x: x.quality_score)
+            if best_balanced:
                 recommendations.append(f"⚖️ **{best_balanced.model_provider}/{best_balanced.model_name}** offers the best balance of quality and speed.")
             
-            # Cost considerations (if token usage is available)
-            cost_efficient = None
-            for result in results:
-                if result.token_usage and result.quality_score and result.quality_score > 0.7:
-                    if not cost_efficient or result.token_usage.get('total_tokens', 0) < cost_efficient.token_usage.get('total_tokens', 0):
-                        cost_efficient = result
-            
             if cost_efficient:
                 recommendations.append(f"💰 **{cost_efficient.model_provider}/{cost_efficient.model_name}** is the most cost-efficient option for good quality.")
             
@@ -903,35 +1152,25 @@ IMPORTANT: Your summary MUST be shorter than the original text. Do not exceed {m
             if not results:
                 return ["No models were successfully compared."]
             
+            best_quality, fastest, longest, _, _, _, best_balanced, cost_efficient = \
+                _scan_for_recommendations(results)
+            
             # Quality recommendations
-            best_quality = max(results, key=lambda x: x.quality_score or 0)
             if best_quality.quality_score and best_quality.quality_score > 0.8:
                 recommendations.append(f"🎯 **{best_quality.model_provider}/{best_quality.model_name}** provides the highest quality generation.")
             
             # Speed recommendations
-            fastest = min(results, key=lambda x: x.latency_ms or float('inf'))
             if fastest.latency_ms and fastest.latency_ms < 2000:  # Less than 2 seconds
                 recommendations.append(f"⚡ **{fastest.model_provider}/{fastest.model_name}** is the fastest option.")
             
             # Length recommendations
-            longest = max(results, key=lambda x: x.generated_length or 0)
             if longest.generated_length and longest.generated_length > 100: # More than 100 words
                 recommendations.append(f"📝 **{longest.model_provider}/{longest.model_name}** provides the longest output.")
             
             # Balanced recommendations
-            balanced_models = [r for r in results if r.quality_score and r.quality_score > 0.7 and 
-                             r.latency_ms and r.latency_ms < 5000]
-            if balanced_models:
-                best_balanced = max(balanced_models, key=lambda x: x.quality_score)
+            if best_balanced:
                 recommendations.append(f"⚖️ **{best_balanced.model_provider}/{best_balanced.model_name}** offers the best balance of quality and speed.")
             
-            # Cost considerations (if token usage is available)
-            cost_efficient = None
-            for result in results:
-                if result.token_usage and result.quality_score and result.quality_score > 0.7:
-                    if not cost_efficient or result.token_usage.get('total_tokens', 0) < cost_efficient.token_usage.get('total_tokens', 0):
-                        cost_efficient = result
-            
             if cost_efficient:
                 recommendations.append(f"💰 **{cost_efficient.model_provider}/{cost_efficient.model_name}** is the most cost-efficient option for good quality.")
             
@@ -951,22 +1190,23 @@ IMPORTANT: Your summary MUST be shorter than the original text. Do not exceed {m
             return ["No models were successfully compared."]
         
         recommendations = []
+        candidates = _scan_for_recommendations(results)
         
         # Quality recommendations
-        best_quality = max(results, key=lambda x: x.quality_score)
+        best_quality = candidates.best_quality
         recommendations.append(f"Best overall quality: {best_quality.model_provider}/{best_quality.model_name} (Score: {best_quality.quality_score:.2f})")
         
         # Speed recommendations
-        fastest = min(results, key=lambda x: x.latency_ms or float('inf'))
+        fastest = candidates.fastest
         if fastest.latency_ms:
             recommendations.append(f"Fastest response: {fastest.model_provider}/{fastest.model_name} ({fastest.latency_ms:.0f}ms)")
         
         # Coherence recommendations
-        most_coherent = max(results, key=lambda x: x.coherence_score)
+        most_coherent = candidates.most_coherent
         recommendations.append(f"Most coherent answer: {most_coherent.model_provider}/{most_coherent.model_name} (Score: {most_coherent.coherence_score:.2f})")
         
         # Relevance recommendations
-        most_relevant = max(results, key=lambda x: x.relevance_score)
+        most_relevant = candidates.most_relevant
         recommendations.append(f"Most relevant answer: {most_relevant.model_provider}/{most_relevant.model_name} (Score: {most_relevant.relevance_score:.2f})")
         
         # Performance insights
@@ -980,9 +1220,7 @@ IMPORTANT: Your summary MUST be shorter than the original text. Do not exceed {m
         return recommendations
 
 
-# Global model comparison service instance
-model_comparison_service = ModelComparisonService()
-
+@lru_cache(maxsize=None)
 def get_model_comparison_service() -> ModelComparisonService:
-    """Get the global model comparison service instance."""
-    return model_comparison_service 
\ No newline at end of file
+    """Get the model comparison service, creating it on first use."""
+    return ModelComparisonService()
@@ -1,55 +1,92 @@
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Tuple, Union
 from langchain.llms.base import LLM
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
 from langchain_ollama import OllamaLLM
 from app.core.config import settings
+import httpx
+import threading
 import time
 
+# Per provider: the settings attribute holding its default model, and the
+# model used when a vision-capable model is requested without a name
+_PROVIDER_SPECS = {
+    "openai": ("openai_model", "gpt-4-vision-preview"),
+    "anthropic": ("anthropic_model", "claude-sonnet-4"),  # Latest vision-capable model
+    "ollama": ("ollama_model", "llava:7b"),
+}
+
+# Generation kwargs passed to model constructors explicitly rather than via **kwargs
+_RESERVED_KWARGS = frozenset(('temperature', 'streaming', 'max_tokens'))
+
 
 class ModelFactory:
     """Factory for creating different LLM instances based on provider."""
     
     def __init__(self):
-        self._models: Dict[str, LLM] = {}
+        # Keyed by (provider, model name or '', vision_capable)
+        self._models: Dict[Tuple[str, str, bool], LLM] = {}
+        # Serializes cache misses so concurrent callers never build the same model twice
+        self._models_lock = threading.Lock()
+        self._openai_http_client: Optional[httpx.AsyncClient] = None
+        self._builders = {
+            "openai": self._create_openai_model,
+            "anthropic": self._create_anthropic_model,
+            "ollama": self._create_ollama_model,
+        }
+    
+    def _get_openai_http_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP/2 client shared by all OpenAI model instances.
+        
+        Sharing one pool lets concurrent requests (e.g. model comparisons) reuse
+        warm TCP/TLS connections instead of each model handshaking on its own.
+        """
+        if self._openai_http_client is None:
+            self._openai_http_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+            )
+        return self._openai_http_client
+    
+    async def aclose(self) -> None:
+        """Close pooled HTTP connections."""
+        if self._openai_http_client is not None:
+            await self._openai_http_client.aclose()
+            self._openai_http_client = None
     
     def get_model(self, provider: str, model_name: Optional[str] = None, vision_capable: bool = False, **kwargs) -> Union[ChatOpenAI, ChatAnthropic, OllamaLLM]:
         """Get or create an LLM instance for the specified provider."""
-        cache_key = f"{provider}:{model_name or 'default'}:vision_{vision_capable}"
+        cache_key = (provider, model_name or '', vision_capable)
         
-        if cache_key not in self._models:
-            self._models[cache_key] = self._create_model(provider, model_name, vision_capable, **kwargs)
+        model = self._models.get(cache_key)
+        if model is None:
+            with self._models_lock:
+                # Another caller may have created it while we waited for the lock
+                model = self._models.get(cache_key)
+                if model is None:
+                    model = self._models[cache_key] = self._create_model(provider, model_name, vision_capable, **kwargs)
         
-        return self._models[cache_key]
+        return model
     
     def _create_model(self, provider: str, model_name: Optional[str] = None, vision_capable: bool = False, **kwargs) -> Union[ChatOpenAI, ChatAnthropic, OllamaLLM]:
         """Create a new LLM instance for the specified provider."""
-        if provider == "openai":
-            return self._create_openai_model(model_name, vision_capable, **kwargs)
-        elif provider == "anthropic":
-            return self._create_anthropic_model(model_name, vision_capable, **kwargs)
-        elif provider == "ollama":
-            return self._create_ollama_model(model_name, vision_capable, **kwargs)
-        else:
+        spec = _PROVIDER_SPECS.get(provider)
+        if spec is None:
             raise ValueError(f"Unsupported model provider: {provider}")
+        
+        # An explicit model name always wins (vision-capable names such as gpt-5 or
+        # claude-sonnet-4 are used as-is); otherwise fall back to the provider default
+        default_model_setting, default_vision_model = spec
+        model = model_name or (default_vision_model if vision_capable else getattr(settings, default_model_setting))
+        return self._builders[provider](model, **kwargs)
     
-    def _create_openai_model(self, model_name: Optional[str] = None, vision_capable: bool = False, **kwargs) -> ChatOpenAI:
+    def _create_openai_model(self, model: str, **kwargs) -> ChatOpenAI:
         """Create OpenAI model instance."""
         if not settings.openai_api_key:
             raise ValueError("OpenAI API key not configured")
         
-        # Use vision model if requested
-        if vision_capable:
-            # GPT-5 has built-in vision capabilities, so use it if available
-            if model_name == "gpt-5":
-                model = "gpt-5"
-            else:
-                model = model_name or "gpt-4-vision-preview"
-        else:
-            model = model_name or settings.openai_model
-            
         # Remove temperature, streaming, and max_tokens from kwargs to avoid duplicates
-        model_kwargs = {k: v for k, v in kwargs.items() if k not in ['temperature', 'streaming', 'max_tokens']}
+        model_kwargs = {k: v for k, v in kwargs.items() if k not in _RESERVED_KWARGS}
         
         return ChatOpenAI(
             model=model,
@@ -57,26 +94,17 @@ class ModelFactory:
             temperature=kwargs.get('temperature', 0.7),
             max_tokens=kwargs.get('max_tokens'),
             streaming=kwargs.get('streaming', True),
+            http_async_client=self._get_openai_http_client(),
             **model_kwargs
         )
     
-    def _create_anthropic_model(self, model_name: Optional[str] = None, vision_capable: bool = False, **kwargs) -> ChatAnthropic:
+    def _create_anthropic_model(self, model: str, **kwargs) -> ChatAnthropic:
         """Create Anthropic model instance."""
         if not settings.anthropic_api_key:
             raise ValueError("Anthropic API key not configured")
         
-        # Use vision model if requested
-        if vision_capable:
-            # Claude Sonnet 4 and Opus 4 have built-in vision capabilities
-            if model_name in ["claude-sonnet-4", "claude-opus-4"]:
-                model = model_name
-            else:
-                model = model_name or "claude-sonnet-4"  # Default to latest vision-capable model
-        else:
-            model = model_name or settings.anthropic_model
-            
         # Remove temperature, streaming, and max_tokens from kwargs to avoid duplicates
-        model_kwargs = {k: v for k, v in kwargs.items() if k not in ['temperature', 'streaming', 'max_tokens']}
+        model_kwargs = {k: v for k, v in kwargs.items() if k not in _RESERVED_KWARGS}
         
         # Provide default max_tokens for Anthropic if None
         max_tokens = kwargs.get('max_tokens')
@@ -92,35 +120,18 @@ class ModelFactory:
             **model_kwargs
         )
     
-    def _create_ollama_model(self, model_name: Optional[str] = None, vision_capable: bool = False, **kwargs) -> OllamaLLM:
+    def _create_ollama_model(self, model: str, **kwargs) -> OllamaLLM:
         """Create Ollama model instance."""
-        # Use vision model if requested
-        if vision_capable:
-            model = model_name or "llava:7b"
-        else:
-            model = model_name or settings.ollama_model
-            
-        # Handle GPT-OSS model name mapping
-        if model == "gpt-oss:20b":
-            # GPT-OSS models require specific configuration for harmony format
-            model_kwargs = {k: v for k, v in kwargs.items() if k not in ['temperature', 'streaming', 'max_tokens']}
-            
-            return OllamaLLM(
-                model=model,
-                base_url=settings.ollama_base_url,
-                temperature=kwargs.get('temperature', 0.7),
-                **model_kwargs
-            )
-        else:
-            # Standard Ollama models
-            model_kwargs = {k: v for k, v in kwargs.items() if k not in ['temperature', 'streaming', 'max_tokens']}
-            
-            return OllamaLLM(
-                model=model,
-                base_url=settings.ollama_base_url,
-                temperature=kwargs.get('temperature', 0.7),
-                **model_kwargs
-            )
+        # Ollama takes neither streaming nor max_tokens; GPT-OSS models (gpt-oss:20b)
+        # use the same configuration as every other Ollama model
+        model_kwargs = {k: v for k, v in kwargs.items() if k not in _RESERVED_KWARGS}
+        
+        return OllamaLLM(
+            model=model,
+            base_url=settings.ollama_base_url,
+            temperature=kwargs.get('temperature', 0.7),
+            **model_kwargs
+        )
 
 
 # Global model factory instance
@@ -1,9 +1,20 @@
 import json
+import orjson
 import yaml
 import re
+from itertools import count
 from typing import Dict, List, Any, Optional
 from app.models.requests import OutputFormat
 
+# Precompiled patterns for the markup validators and list formatters
+_OPEN_TAG_RE = re.compile(r'<[^/][^>]*>')
+_CLOSE_TAG_RE = re.compile(r'</[^>]+>')
+_BULLET_RE = re.compile(r'^[\•\-\*]\s')
+_NUMBERED_RE = re.compile(r'^\d+\.\s')
+
+# Use the libyaml-backed safe loader when PyYAML was built with it
+_YAML_SAFE_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 class OutputFormatterService:
     """Service for formatting responses in different output formats."""
@@ -21,15 +32,34 @@ class OutputFormatterService:
             OutputFormat.TABLE: "Format your response as a table using Markdown table syntax with | separators and header rows.",
             OutputFormat.TEXT: "Provide a clear, well-structured text response."
         }
+        self.default_format_instruction = "Provide a clear, well-structured response."
+        # System prompt suffixes, built once so formatting a prompt is a single concatenation
+        self._prompt_suffixes = {
+            output_format: f"\n\n{instruction}"
+            for output_format, instruction in self.format_instructions.items()
+        }
+        self._default_prompt_suffix = f"\n\n{self.default_format_instruction}"
+        # Response handlers by output format, looked up once per response
+        self._validators = {
+            OutputFormat.JSON: (self._is_valid_json, "Invalid JSON format"),
+            OutputFormat.XML: (self._is_valid_xml, "Invalid XML format"),
+            OutputFormat.YAML: (self._is_valid_yaml, "Invalid YAML format"),
+            OutputFormat.CSV: (self._is_valid_csv, "Invalid CSV format"),
+            OutputFormat.HTML: (self._is_valid_html, "Invalid HTML format"),
+        }
+        self._formatters = {
+            OutputFormat.BULLET_POINTS: self._format_as_bullet_points,
+            OutputFormat.NUMBERED_LIST: self._format_as_numbered_list,
+            OutputFormat.TABLE: self._format_as_table,
+        }
     
     def get_format_instruction(self, output_format: OutputFormat) -> str:
         """Get the format instruction for the specified output format."""
-        return self.format_instructions.get(output_format, "Provide a clear, well-structured response.")
+        return self.format_instructions.get(output_format, self.default_format_instruction)
     
     def format_system_prompt(self, base_prompt: str, output_format: OutputFormat) -> str:
         """Add output format instructions to the system prompt."""
-        format_instruction = self.get_format_instruction(output_format)
-        return f"{base_prompt}\n\n{format_instruction}"
+        return base_prompt + self._prompt_suffixes.get(output_format, self._default_prompt_suffix)
     
     def validate_and_format_response(self, response: str, output_format: OutputFormat) -> Dict[str, Any]:
         """Validate and format the response based on the output format."""
@@ -41,52 +71,20 @@ class OutputFormatterService:
         }
         
         try:
-            if output_format == OutputFormat.JSON:
-                # Try to parse as JSON to validate
-                json.loads(response)
-                result["formatted_content"] = response
-                
-            elif output_format == OutputFormat.XML:
-                # Basic XML validation
-                if not self._is_valid_xml(response):
-                    result["is_valid"] = False
-                    result["validation_message"] = "Invalid XML format"
-                result["formatted_content"] = response
-                
-            elif output_format == OutputFormat.YAML:
-                # Try to parse as YAML to validate
-                yaml.safe_load(response)
-                result["formatted_content"] = response
-                
-            elif output_format == OutputFormat.CSV:
-                # Basic CSV validation
-                if not self._is_valid_csv(response):
-                    result["is_valid"] = False
-                    result["validation_message"] = "Invalid CSV format"
-                result["formatted_content"] = response
-                
-            elif output_format == OutputFormat.HTML:
-                # Basic HTML validation
-                if not self._is_valid_html(response):
+            validator = self._validators.get(output_format)
+            if validator is not None:
+                # Parser-backed checks raise on invalid input; the structural
+                # checks return False and report the format's own message
+                is_valid, invalid_message = validator
+                if not is_valid(response):
                     result["is_valid"] = False
-                    result["validation_message"] = "Invalid HTML format"
-                result["formatted_content"] = response
-                
-            elif output_format == OutputFormat.BULLET_POINTS:
-                # Format as bullet points if not already
-                result["formatted_content"] = self._format_as_bullet_points(response)
-                
-            elif output_format == OutputFormat.NUMBERED_LIST:
-                # Format as numbered list if not already
-                result["formatted_content"] = self._format_as_numbered_list(response)
-                
-            elif output_format == OutputFormat.TABLE:
-                # Format as table if not already
-                result["formatted_content"] = self._format_as_table(response)
-                
+                    result["validation_message"] = invalid_message
             else:
-                # TEXT, MARKDOWN - no special validation needed
-                result["formatted_content"] = response
+                # Bullet points, numbered lists and tables are reformatted if not
+                # already; TEXT and MARKDOWN need no special handling
+                formatter = self._formatters.get(output_format)
+                if formatter is not None:
+                    result["formatted_content"] = formatter(response)
                 
         except Exception as e:
             result["is_valid"] = False
@@ -95,74 +93,69 @@ class OutputFormatterService:
         
         return result
     
+    def _is_valid_json(self, text: str) -> bool:
+        """JSON validation by parsing; raises on invalid JSON."""
+        try:
+            orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the stdlib parser (NaN/Infinity, out-of-range
+            # numbers, lone surrogates); only rejected input pays for a second parse
+            json.loads(text)
+        return True
+    
+    def _is_valid_yaml(self, text: str) -> bool:
+        """YAML validation by parsing; raises on invalid YAML."""
+        yaml.load(text, Loader=_YAML_SAFE_LOADER)
+        return True
+    
+    def _has_tag_structure(self, text: str) -> bool:
+        """Check that text contains both an opening and a closing markup tag."""
+        # The closing tag pattern is more selective, so look for it first and
+        # skip the second scan on plain text
+        return bool(_CLOSE_TAG_RE.search(text)) and bool(_OPEN_TAG_RE.search(text))
+    
     def _is_valid_xml(self, text: str) -> bool:
         """Basic XML validation."""
-        # Check for basic XML structure
-        has_open_tags = bool(re.search(r'<[^/][^>]*>', text))
-        has_close_tags = bool(re.search(r'</[^>]+>', text))
-        return has_open_tags and has_close_tags
+        return self._has_tag_structure(text)
     
     def _is_valid_csv(self, text: str) -> bool:
         """Basic CSV validation."""
-        lines = text.strip().split('\n')
-        if len(lines) < 1:
-            return False
-        
-        # Check if lines contain commas
-        return any(',' in line for line in lines)
+        # Some line has to contain a comma, which is the same as the text containing one
+        return ',' in text
     
     def _is_valid_html(self, text: str) -> bool:
         """Basic HTML validation."""
-        # Check for basic HTML structure
-        has_open_tags = bool(re.search(r'<[^/][^>]*>', text))
-        has_close_tags = bool(re.search(r'</[^>]+>', text))
-        return has_open_tags and has_close_tags
+        return self._has_tag_structure(text)
     
     def _format_as_bullet_points(self, text: str) -> str:
         """Format text as bullet points."""
-        lines = text.strip().split('\n')
-        formatted_lines = []
-        
-        for line in lines:
-            line = line.strip()
-            if line:
-                # If line doesn't already start with a bullet point, add one
-                if not re.match(r'^[\•\-\*]\s', line):
-                    formatted_lines.append(f"• {line}")
-                else:
-                    formatted_lines.append(line)
-        
-        return '\n'.join(formatted_lines)
+        lines = (line.strip() for line in text.splitlines())
+        # If a line doesn't already start with a bullet point, add one
+        return '\n'.join(
+            line if _BULLET_RE.match(line) else f"• {line}"
+            for line in lines if line
+        )
     
     def _format_as_numbered_list(self, text: str) -> str:
         """Format text as a numbered list."""
-        lines = text.strip().split('\n')
-        formatted_lines = []
-        counter = 1
-        
-        for line in lines:
-            line = line.strip()
-            if line:
-                # If line doesn't already start with a number, add one
-                if not re.match(r'^\d+\.\s', line):
-                    formatted_lines.append(f"{counter}. {line}")
-                    counter += 1
-                else:
-                    formatted_lines.append(line)
-        
-        return '\n'.join(formatted_lines)
+        lines = (line.strip() for line in text.splitlines())
+        # If a line doesn't already start with a number, add the next one;
+        # already numbered lines keep their number and don't advance the counter
+        counter = count(1)
+        return '\n'.join(
+            line if _NUMBERED_RE.match(line) else f"{next(counter)}. {line}"
+            for line in lines if line
+        )
     
     def _format_as_table(self, text: str) -> str:
         """Format text as a Markdown table."""
-        lines = text.strip().split('\n')
-        
         # If it's already a table, return as is
-        if any('|' in line for line in lines):
+        if '|' in text:
             return text
         
         # Try to extract key-value pairs or structured data
         table_data = []
-        for line in lines:
+        for line in text.splitlines():
             line = line.strip()
             if ':' in line:
                 key, value = line.split(':', 1)
@@ -1,5 +1,7 @@
+from collections import defaultdict
 from typing import Dict, List, Optional
 from enum import Enum
+import orjson
 
 
 class TemplateCategory(str, Enum):
@@ -10,6 +12,13 @@ class TemplateCategory(str, Enum):
     PERSONAL = "personal"
 
 
+class _PlaceholderDict(dict):
+    """Mapping for str.format_map that keeps unknown placeholders intact."""
+    
+    def __missing__(self, key: str) -> str:
+        return f"{{{key}}}"
+
+
 class PromptTemplate:
     def __init__(self, id: str, name: str, description: str, category: TemplateCategory, 
                  system_prompt: str, user_prompt_template: str, variables: List[str]):
@@ -20,9 +29,10 @@ class PromptTemplate:
         self.system_prompt = system_prompt
         self.user_prompt_template = user_prompt_template
         self.variables = variables
-    
-    def to_dict(self) -> Dict:
-        return {
+        # Set view of the variables for membership tests; the list keeps API order
+        self._variables_set = frozenset(variables)
+        # Templates are never modified after construction, so serialize them once
+        self._dict = {
             "id": self.id,
             "name": self.name,
             "description": self.description,
@@ -31,11 +41,30 @@ class PromptTemplate:
             "user_prompt_template": self.user_prompt_template,
             "variables": self.variables
         }
+    
+    def to_dict(self) -> Dict:
+        return self._dict
 
 
 class PromptTemplateService:
     def __init__(self):
         self.templates = self._initialize_templates()
+        # Index the fixed template set once; self.templates keeps the display order
+        self._by_id: Dict[str, PromptTemplate] = {t.id: t for t in self.templates}
+        # Serialized templates, overall and per category, as returned by the getters
+        self._all_dicts = [template.to_dict() for template in self.templates]
+        self._category_dicts: Dict[TemplateCategory, List[Dict]] = defaultdict(list)
+        for template in self.templates:
+            self._category_dicts[template.category].append(template.to_dict())
+        # Pre-encoded bodies for the template listing routes
+        self._all_templates_json = orjson.dumps({
+            "templates": self._all_dicts,
+            "categories": self.get_categories()
+        })
+        self._category_templates_json: Dict[TemplateCategory, bytes] = {
+            category: orjson.dumps({"templates": self._category_dicts.get(category, []), "category": category.value})
+            for category in TemplateCategory
+        }
     
     def _initialize_templates(self) -> List[PromptTemplate]:
         """Initialize predefined prompt templates."""
@@ -188,19 +217,26 @@ class PromptTemplateService:
     
     def get_all_templates(self) -> List[Dict]:
         """Get all available templates."""
-        return [template.to_dict() for template in self.templates]
+        return list(self._all_dicts)
     
     def get_templates_by_category(self, category: TemplateCategory) -> List[Dict]:
         """Get templates filtered by category."""
-        filtered_templates = [t for t in self.templates if t.category == category]
-        return [template.to_dict() for template in filtered_templates]
+        return list(self._category_dicts.get(category, ()))
+    
+    def get_all_templates_json(self) -> bytes:
+        """Get all templates and categories as a pre-encoded JSON response body."""
+        return self._all_templates_json
+    
+    def get_templates_by_category_json(self, category: str) -> bytes:
+        """Get templates filtered by category as a pre-encoded JSON response body."""
+        body = self._category_templates_json.get(category)
+        if body is None:
+            body = orjson.dumps({"templates": [], "category": category})
+        return body
     
     def get_template_by_id(self, template_id: str) -> Optional[PromptTemplate]:
         """Get a specific template by ID."""
-        for template in self.templates:
-            if template.id == template_id:
-                return template
-        return None
+        return self._by_id.get(template_id)
     
     def get_categories(self) -> List[str]:
         """Get all available template categories."""
@@ -215,11 +251,12 @@ class PromptTemplateService:
         # Fill system prompt
         system_prompt = template.system_prompt
         
-        # Fill user prompt template
-        user_prompt = template.user_prompt_template
-        for var_name, value in variables.items():
-            if var_name in template.variables:
-                user_prompt = user_prompt.replace(f"{{{var_name}}}", value)
+        # Fill user prompt template in a single pass; placeholders without a
+        # provided (and declared) variable are left as they are
+        user_prompt = template.user_prompt_template.format_map(_PlaceholderDict(
+            (var_name, value) for var_name, value in variables.items()
+            if var_name in template._variables_set
+        ))
         
         return {
             "system_prompt": system_prompt,
@@ -1,12 +1,44 @@
+import heapq
 import re
 import random
 import time
+from collections import Counter
 from typing import List, Dict, Any
 from app.services.rag_service import rag_service
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Service-related terms (already lowercase) picked up as topics when present
+_SERVICE_TERMS = (
+    'property management', 'leasing', 'maintenance', 'rental',
+    'tenant', 'landlord', 'property', 'management', 'services',
+    'repairs', 'inspections', 'advertising', 'showings'
+)
+
+# Common words never used as business-term topics
+_STOP_WORDS = frozenset((
+    'the', 'and', 'for', 'with', 'this', 'that', 'will', 'shall', 'have', 'been', 'from', 'they', 'their'
+))
+# Single capitalized words are filtered against a wider list of short common words
+_CAPITALIZED_STOP_WORDS = _STOP_WORDS | frozenset((
+    'all', 'are', 'but', 'not', 'you', 'can', 'had', 'her', 'was', 'one', 'our', 'out', 'day',
+    'get', 'has', 'him', 'his', 'how', 'man', 'new', 'now', 'old', 'see', 'two', 'who', 'boy',
+    'did', 'its', 'let', 'put', 'say', 'she', 'too', 'use'
+))
+# Section headers too generic to make good questions
+_GENERIC_HEADERS = frozenset(('parties', 'agreement', 'terms', 'conditions', 'section'))
+
+# Precompiled topic extraction patterns
+# Company names: capitalized words followed by a company suffix
+_COMPANY_RE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:Management|Company|Corp|Inc|LLC|Ltd)\b')
+# Section headers: short numbered items or capitalized lines ending in a colon
+_HEADER_RE = re.compile(r'^\d+\.\s*([^:\n]{3,30}):?$|^([A-Z][^:\n]{3,30}):$', re.MULTILINE)
+# Business terms: runs of two to four capitalized words
+_BUSINESS_TERM_RE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3}\b')
+# Fallback topics: single capitalized words of three or more letters
+_CAPITALIZED_WORD_RE = re.compile(r'\b[A-Z][a-z]{2,}\b')
+
 class QuestionSuggestionService:
     """Service for generating intelligent question suggestions based on document content."""
     
@@ -24,6 +56,14 @@ class QuestionSuggestionService:
             "What should I know about {topic}?"
         ]
         
+        # Topic questions as %-style formats, converted once. "How do I {action}?"
+        # takes an action rather than a topic, so it is not used for topics
+        self._topic_question_formats = [
+            template.replace("{topic}", "%s")
+            for template in self.common_question_templates
+            if "{topic}" in template
+        ]
+        
         self.action_templates = [
             "get started",
             "contact support",
@@ -36,88 +76,54 @@ class QuestionSuggestionService:
     
     def extract_topics_from_text(self, text: str) -> List[str]:
         """Extract potential topics from document text."""
-        # Simple topic extraction based on common patterns
+        # Simple topic extraction based on common patterns. Topics are kept unique
+        # and in discovery order as they are found; seen mirrors topics for lookups
         topics = []
+        seen = set()
         
-        # Look for company names (capitalized words)
-        company_pattern = r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:Management|Company|Corp|Inc|LLC|Ltd)\b'
-        companies = re.findall(company_pattern, text)
-        topics.extend(companies)
+        def add_topics(candidates):
+            for topic in candidates:
+                if topic not in seen:
+                    seen.add(topic)
+                    topics.append(topic)
         
-        # Look for service-related terms that have substantial content
-        service_terms = [
-            'property management', 'leasing', 'maintenance', 'rental', 
-            'tenant', 'landlord', 'property', 'management', 'services',
-            'repairs', 'inspections', 'advertising', 'showings'
-        ]
+        # Look for company names (capitalized words)
+        add_topics(_COMPANY_RE.findall(text))
         
-        for term in service_terms:
-            if term.lower() in text.lower():
-                # Count how many times this term appears to gauge importance
-                count = text.lower().count(term.lower())
-                if count >= 1:  # Reduced threshold to catch more terms
-                    topics.append(term.title())
+        # Look for service-related terms that appear anywhere in the text
+        text_lower = text.lower()
+        add_topics(term.title() for term in _SERVICE_TERMS if term in text_lower)
         
         # Look for section headers (lines with colons or numbered items)
         # Improved pattern to avoid very long matches and focus on meaningful headers
-        header_pattern = r'^\d+\.\s*([^:\n]{3,30}):?$|^([A-Z][^:\n]{3,30}):$'
-        headers = re.findall(header_pattern, text, re.MULTILINE)
-        for header in headers:
-            if header[0]:  # numbered items
-                clean_header = header[0].strip()
-                # Filter out headers that are too generic or don't make good questions
-                if (len(clean_header) <= 30 and 
-                    clean_header.lower() not in ['parties', 'agreement', 'terms', 'conditions', 'section'] and
-                    not clean_header.isupper()):  # Avoid all-caps headers
-                    topics.append(clean_header)
-            elif header[1]:  # colon headers
-                clean_header = header[1].strip()
-                # Filter out headers that are too generic or don't make good questions
-                if (len(clean_header) <= 30 and 
-                    clean_header.lower() not in ['parties', 'agreement', 'terms', 'conditions', 'section'] and
-                    not clean_header.isupper()):  # Avoid all-caps headers
-                    topics.append(clean_header)
-        
-        # Look for common business terms (capitalized phrases) that appear multiple times
-        business_terms_pattern = r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3}\b'
-        business_terms = re.findall(business_terms_pattern, text)
+        headers = []
+        for numbered, colon in _HEADER_RE.findall(text):
+            clean_header = (numbered or colon).strip()
+            # Filter out headers that are too generic or don't make good questions
+            if (len(clean_header) <= 30 and
+                clean_header.lower() not in _GENERIC_HEADERS and
+                not clean_header.isupper()):  # Avoid all-caps headers
+                headers.append(clean_header)
+        add_topics(headers)
         
-        # Filter business terms to avoid very long ones and count frequency
-        term_freq = {}
-        for term in business_terms:
-            if 3 <= len(term) <= 50 and term not in topics:
-                # Avoid terms that are just common words
-                if not term.lower() in ['the', 'and', 'for', 'with', 'this', 'that', 'will', 'shall', 'have', 'been', 'from', 'they', 'their']:
-                    term_freq[term] = term_freq.get(term, 0) + 1
-        
-        # Include terms that appear at least once (reduced threshold)
-        for term, freq in term_freq.items():
-            if freq >= 1:
-                topics.append(term)
+        # Look for common business terms (capitalized phrases)
+        add_topics(
+            term for term in _BUSINESS_TERM_RE.findall(text)
+            if 3 <= len(term) <= 50 and term.lower() not in _STOP_WORDS
+        )
         
         # Look for any capitalized words that might be important topics
         # This is a fallback to catch more potential topics
-        capitalized_words = re.findall(r'\b[A-Z][a-z]{2,}\b', text)
-        word_freq = {}
-        for word in capitalized_words:
-            if word not in topics and len(word) >= 3:
-                # Avoid common words
-                if word.lower() not in ['the', 'and', 'for', 'with', 'this', 'that', 'will', 'shall', 'have', 'been', 'from', 'they', 'their', 'all', 'are', 'but', 'not', 'you', 'can', 'had', 'her', 'was', 'one', 'our', 'out', 'day', 'get', 'has', 'him', 'his', 'how', 'man', 'new', 'now', 'old', 'see', 'two', 'who', 'boy', 'did', 'its', 'let', 'put', 'say', 'she', 'too', 'use']:
-                    word_freq[word] = word_freq.get(word, 0) + 1
-        
-        # Include capitalized words that appear at least once
-        for word, freq in word_freq.items():
-            if freq >= 1 and word not in topics:
-                topics.append(word)
+        add_topics(
+            word for word in _CAPITALIZED_WORD_RE.findall(text)
+            if len(word) >= 3 and word.lower() not in _CAPITALIZED_STOP_WORDS
+        )
         
-        # Remove duplicates and limit to top topics
-        unique_topics = list(set(topics))
-        # Sort by length (prefer shorter, cleaner topics)
-        unique_topics.sort(key=len)
+        # Keep the shortest (cleanest) topics, in discovery order among equal lengths
+        unique_topics = heapq.nsmallest(8, topics, key=len)
         
         # If we still don't have enough topics, add some generic ones based on content
         if len(unique_topics) < 3:
-            text_lower = text.lower()
             if any(word in text_lower for word in ['contract', 'agreement', 'terms']):
                 unique_topics.extend(['Contract', 'Agreement', 'Terms'])
             if any(word in text_lower for word in ['policy', 'procedure', 'guidelines']):
@@ -181,14 +187,8 @@ class QuestionSuggestionService:
                 document_texts.append(doc)
                 logger.info(f"Document {i+1}: Found {len(topics)} topics: {topics}")
             
-            # Get unique topics and their frequency
-            topic_freq = {}
-            for topic in all_topics:
-                topic_freq[topic] = topic_freq.get(topic, 0) + 1
-            
-            # Sort by frequency
-            sorted_topics = sorted(topic_freq.items(), key=lambda x: x[1], reverse=True)
-            top_topics = [topic for topic, freq in sorted_topics[:5]]
+            # Take the most frequent topics; ties keep the order topics were first seen
+            top_topics = [topic for topic, freq in Counter(all_topics).most_common(5)]
             logger.info(f"Top topics found: {top_topics}")
             
             # Analyze document content to determine document types and themes
@@ -205,8 +205,7 @@ class QuestionSuggestionService:
                 if topic not in seen_topics:
                     seen_topics.add(topic)
                     # Randomly select a question template for variety
-                    template = random.choice(self.common_question_templates)
-                    question = template.format(topic=topic)
+                    question = random.choice(self._topic_question_formats) % topic
                     suggestions.append({
                         "question": question,
                         "type": "topic",
@@ -1,16 +1,31 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.routes import router
 from app.core.config import settings
+from app.services.model_availability_service import get_model_availability_service
+from app.services.model_factory import model_factory
 import uvicorn
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown."""
+    yield
+    # Close pooled HTTP connections on shutdown, if the service was ever created
+    if get_model_availability_service.cache_info().currsize:
+        await get_model_availability_service().close()
+    await model_factory.aclose()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="GenAI Lab API",
     description="A full-stack web application for experimenting with different GenAI use cases",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -109,6 +109,10 @@ setup_backend() {
     echo -e "${YELLOW}📦 Installing Python dependencies...${NC}"
     pip install -r requirements.txt
     
+    # Download NLTK data ahead of time so the backend does not fetch it at startup
+    echo -e "${YELLOW}📦 Downloading NLTK data...${NC}"
+    python -m nltk.downloader -q punkt stopwords vader_lexicon
+    
     # Verify installation
     echo -e "${YELLOW}🔍 Verifying installation...${NC}"
     python -c "import fastapi, langchain, openai, anthropic, textstat; print('✅ All key dependencies installed')"